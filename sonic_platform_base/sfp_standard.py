@@ -9,24 +9,18 @@ from __future__ import print_function
 
 try:
     import abc
-    import sys
+    import errno
+    import os
     import time
     import syslog
+    import threading
+    import math
+    import struct
+    from types import MappingProxyType
 
-    from datetime import datetime
     from multiprocessing import Lock
     from .sfp_base import SfpBase
     from .sonic_sfp.sff8024 import connector_dict
-    from .sonic_sfp.sff8436 import sff8436InterfaceId
-    from .sonic_sfp.sff8436 import sff8436Dom
-    from .sonic_sfp.sff8472 import sff8472InterfaceId
-    from .sonic_sfp.sff8472 import sff8472Dom
-    from .sonic_sfp.inf8628 import inf8628InterfaceId
-    from .sonic_sfp.inf8628 import inf8628Dom
-    from .sonic_sfp.inf8628 import inf8628Diag
-    from .sonic_sfp.mis2 import mis2InterfaceId
-    from .sonic_sfp.mis2 import mis2Dom
-    from .sonic_sfp.mis2 import mis2Diag
 except ImportError as ex:
     raise ImportError (str(ex) + "- required module not found")
 
@@ -49,6 +43,60 @@ mis_cable_length_types = [
     'Length Cable Assembly(m)', 'Length SMF(km)', 'Length OM5(2m)',
     'Length OM4(2m)', 'Length OM3(2m)', 'Length OM2(m)'
 ]
+
+# transceiver_info_dict keys copied as is from the parsed interface ID,
+# with their parser field names
+sfp_info_keys = MappingProxyType({
+    'type':             'TypeOfTransceiver',
+    'type_abbrv_name':  'type_abbrv_name',
+    'manufacturer':     'VendorName',
+    'model':            'VendorPN',
+    'hardware_rev':     'VendorRev',
+    'serial':           'VendorSN',
+    'connector':        'Connector',
+    'encoding':         'EncodingCodes',
+    'ext_identifier':   'ExtIdentOfTypeOfTransceiver',
+    'nominal_bit_rate': 'NominalSignallingRate(UnitsOf100Mbd)',
+    'vendor_date':      'VendorDataCode(YYYY-MM-DD Lot)',
+    'vendor_oui':       'VendorOUI',
+    'option_values':    'OptionValues',
+})
+
+qsfp_info_keys = MappingProxyType({
+    'type':                      'Identifier',
+    'type_abbrv_name':           'type_abbrv_name',
+    'ext_identifier':            'Extended Identifier',
+    'encoding':                  'Encoding',
+    'ext_rateselect_compliance': 'Extended RateSelect Compliance',
+    'connector':                 'Connector',
+    'hardware_rev':              'Vendor Rev',
+    'manufacturer':              'Vendor Name',
+    'model':                     'Vendor PN',
+    'memory_type':               'Upper Memory Type',
+    'nominal_bit_rate':          'Nominal Bit Rate(100Mbs)',
+    'serial':                    'Vendor SN',
+    'vendor_date':               'Vendor Date Code(YYYY-MM-DD Lot)',
+    'vendor_oui':                'Vendor OUI',
+})
+
+cmis_info_keys = MappingProxyType({
+    'type':                'Identifier',
+    'type_abbrv_name':     'type_abbrv_name',
+    'manufacturer':        'Vendor Name',
+    'model':               'Vendor Part Number',
+    'hardware_rev':        'Vendor Revision',
+    'serial':              'Vendor Serial Number',
+    'vendor_date':         'Vendor Date Code(YYYY-MM-DD Lot)',
+    'vendor_oui':          'Vendor OUI',
+    'module_state':        'Module State',
+    'media_type':          'Media Type',
+    'memory_type':         'Upper Memory Type',
+    'power_class':         'Power Class',
+    'revision_compliance': 'Revision Compliance',
+})
+
+mis_info_keys = cmis_info_keys
+
 XCVR_EEPROM_TYPE_UNKNOWN = 0
 XCVR_EEPROM_TYPE_SFP     = 1
 XCVR_EEPROM_TYPE_QSFP    = 2
@@ -63,8 +111,121 @@ SFF8024_TYPE_QSFPDD              = ['18','19']
 SFF8024_TYPE_QSFP_CMIS_COMPLIANT = ['1e']      # Follows CMIS Spec (v3.0 or higher)
 SFF8024_TYPE_SFPDD               = ['1a']
 
+# Precomputed identifier sets for the membership tests on the hot paths
+SFF8024_TYPE_QSFP_SET            = frozenset(SFF8024_TYPE_QSFP)
+SFF8024_TYPE_CMIS_SET            = frozenset(SFF8024_TYPE_QSFPDD + SFF8024_TYPE_QSFP_CMIS_COMPLIANT)
+
+# The same identifiers as integers, for the checks on raw EEPROM bytes
+SFF8024_TYPE_QSFP_ID_SET         = frozenset([int(id, 16) for id in SFF8024_TYPE_QSFP])
+SFF8024_TYPE_QSFPDD_ID_SET       = frozenset([int(id, 16) for id in SFF8024_TYPE_QSFPDD])
+SFF8024_TYPE_QSFP_CMIS_COMPLIANT_ID_SET = frozenset([int(id, 16) for id in SFF8024_TYPE_QSFP_CMIS_COMPLIANT])
+SFF8024_TYPE_SFPDD_ID_SET        = frozenset([int(id, 16) for id in SFF8024_TYPE_SFPDD])
+SFF8024_TYPE_CMIS_ID_SET         = SFF8024_TYPE_QSFPDD_ID_SET | SFF8024_TYPE_QSFP_CMIS_COMPLIANT_ID_SET
+SFF8024_TYPE_QSFP_ANY_ID_SET     = SFF8024_TYPE_QSFP_ID_SET | SFF8024_TYPE_CMIS_ID_SET
+
+# QSFP56 media type, module media interface, host/media lane counts and
+# lane assignment (bytes 85 to 89) of the supported 200G CMIS modules
+QSFP56_EEPROM_IDENTIFIERS        = frozenset([
+    b'\x01\x0f\x0e\x44\x01',    # 200G QSFP56 SR4
+    b'\x02\x0f\x18\x44\x01'     # 200G QSFP56 FR4
+    ])
+
+# SFF-8024 connector types of the direct attach cables
+DAC_CONNECTOR_TYPES              = frozenset(['Copper pigtail', 'No separable connector'])
+
+# SFF-8636 transmitter technologies (byte 147, bits 7-4) of the passive
+# copper cables, unequalized and equalized
+SFF8636_PASSIVE_COPPER_TECHS     = frozenset([0x0a, 0x0b])
+
+# SFF-8636 link codes (byte 192) of the optical modules with a wavelength
+SFF8636_WAVELENGTH_LINK_CODES    = frozenset([
+    0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x17, 0x18,
+    0x1A, 0x1B, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27
+    ])
+
+# SFP max speed by the minimum nominal signalling rate (units of 100Mbd),
+# anything slower is reported as 1G
+SFF8472_SPEED_MAX_BY_NBR         = ((250, '25000'), (100, '10000'))
+
+# SFF-8472 status/control states as reported in the DOM info, any other
+# state than 'On' is 'false'
+SFF8472_DOM_STATE_STR            = {'On': 'true'}
+
+def _dom_lane_keys(fmt_dst, fmt_src, lanes):
+    return tuple((fmt_dst.format(i), fmt_src.format(i)) for i in range(1, lanes + 1))
+
+# (transceiver_dom_info_dict key, parser key) pairs of the bulk status
+CMIS_DOM_KEYS                    = (('temperature', 'Temperature'), ('voltage', 'Vcc')) + \
+                                   _dom_lane_keys('rx{}power', 'RX{}Power', 8) + \
+                                   _dom_lane_keys('tx{}bias', 'TX{}Bias', 8) + \
+                                   _dom_lane_keys('tx{}power', 'TX{}Power', 8)
+MIS_DOM_KEYS                     = (('temperature', 'Temperature'), ('voltage', 'Vcc')) + \
+                                   _dom_lane_keys('rx{}power', 'RX{}Power', 2) + \
+                                   _dom_lane_keys('tx{}bias', 'TX{}Bias', 2) + \
+                                   _dom_lane_keys('tx{}power', 'TX{}Power', 2)
+SFF8636_DOM_CHAN_KEYS            = _dom_lane_keys('rx{}power', 'RX{}Power', 4) + \
+                                   _dom_lane_keys('tx{}bias', 'TX{}Bias', 4)
+SFF8636_DOM_TXPWR_KEYS           = _dom_lane_keys('tx{}power', 'TX{}Power', 4)
+
+# (transceiver_dom_threshold_info_dict key, parser key) pairs of the threshold info
+DOM_THRES_MODULE_KEYS = (
+    ('temphighalarm',    'TempHighAlarm'),
+    ('temphighwarning',  'TempHighWarning'),
+    ('templowalarm',     'TempLowAlarm'),
+    ('templowwarning',   'TempLowWarning'),
+    ('vcchighalarm',     'VccHighAlarm'),
+    ('vcchighwarning',   'VccHighWarning'),
+    ('vcclowalarm',      'VccLowAlarm'),
+    ('vcclowwarning',    'VccLowWarning'),
+)
+DOM_THRES_CHANNEL_KEYS = (
+    ('rxpowerhighalarm',    'RxPowerHighAlarm'),
+    ('rxpowerhighwarning',  'RxPowerHighWarning'),
+    ('rxpowerlowalarm',     'RxPowerLowAlarm'),
+    ('rxpowerlowwarning',   'RxPowerLowWarning'),
+    ('txpowerhighalarm',    'TxPowerHighAlarm'),
+    ('txpowerhighwarning',  'TxPowerHighWarning'),
+    ('txpowerlowalarm',     'TxPowerLowAlarm'),
+    ('txpowerlowwarning',   'TxPowerLowWarning'),
+    ('txbiashighalarm',     'TxBiasHighAlarm'),
+    ('txbiashighwarning',   'TxBiasHighWarning'),
+    ('txbiaslowalarm',      'TxBiasLowAlarm'),
+    ('txbiaslowwarning',    'TxBiasLowWarning'),
+)
+DOM_THRES_CHANNEL_NO_TXPWR_KEYS = tuple(key for key in DOM_THRES_CHANNEL_KEYS if not key[0].startswith('txpower'))
+SFF8472_DOM_THRES_MODULE_KEYS = (
+    ('temphighalarm',    'TempHighAlarm'),
+    ('temphighwarning',  'TempHighWarning'),
+    ('templowalarm',     'TempLowAlarm'),
+    ('templowwarning',   'TempLowWarning'),
+    ('vcchighalarm',     'VoltageHighAlarm'),
+    ('vcchighwarning',   'VoltageHighWarning'),
+    ('vcclowalarm',      'VoltageLowAlarm'),
+    ('vcclowwarning',    'VoltageLowWarning'),
+)
+SFF8472_DOM_THRES_CHANNEL_KEYS = (
+    ('rxpowerhighalarm',    'RXPowerHighAlarm'),
+    ('rxpowerhighwarning',  'RXPowerHighWarning'),
+    ('rxpowerlowalarm',     'RXPowerLowAlarm'),
+    ('rxpowerlowwarning',   'RXPowerLowWarning'),
+    ('txpowerhighalarm',    'TXPowerHighAlarm'),
+    ('txpowerhighwarning',  'TXPowerHighWarning'),
+    ('txpowerlowalarm',     'TXPowerLowAlarm'),
+    ('txpowerlowwarning',   'TXPowerLowWarning'),
+    ('txbiashighalarm',     'BiasHighAlarm'),
+    ('txbiashighwarning',   'BiasHighWarning'),
+    ('txbiaslowalarm',      'BiasLowAlarm'),
+    ('txbiaslowwarning',    'BiasLowWarning'),
+)
+# Threshold info with every value not available, in the key order of the
+# module and channel key tables above
+DOM_THRES_NA = MappingProxyType(
+    {}.fromkeys([key for key, _ in DOM_THRES_MODULE_KEYS + DOM_THRES_CHANNEL_KEYS], 'N/A'))
+
 SFF8472_CONNECTOR_ADDR           = 2
 SFF8472_ENHANCED_OPTS_ADDR       = 93
+SFF8472_CABLE_TECH_ADDR          = 8
+SFF8472_CABLE_TECH_PASSIVE       = 0x04
 SFF8472_ENHANCED_OPTS_RX_LOS     = 0x10
 SFF8472_ENHANCED_OPTS_TX_FAULT   = 0x20
 SFF8472_ENHANCED_OPTS_TX_DISABLE = 0x40
@@ -94,6 +255,7 @@ SFF8472_CC_BASE_START            = 0
 
 # QSFP+/QSFP28
 SFF8636_CONNECTOR_ADDR           = 130
+SFF8636_DEVICE_TECH_ADDR         = 147
 SFF8636_PWR_CTRL_ADDR            = 93
 SFF8636_MOD_STATE_ADDR           = 2
 SFF8636_MOD_STATE_NOT_READY      = 0x01
@@ -111,15 +273,53 @@ SFF8636_DOM_TXPWR_WARM_HI_ADDR   = (196 & 0x7f) | 0x200
 SFF8636_DOM_TXPWR_WARM_LO_ADDR   = (198 & 0x7f) | 0x200
 SFF8636_DOM_CHAN_MON_ADDR        = 34
 SFF8636_DOM_TYPE_ADDR            = 220
+SFF8636_DOM_TYPE_TXPWR           = 0x04
 SFF8636_DOM_THRES_ADDR           = 512
 SFF8636_DOM_THRES_MODULE_OFFSET  = 0
 SFF8636_DOM_THRES_CHANNEL_OFFSET = 48
 SFF8636_CC_BASE                  = 191
 SFF8636_CC_BASE_START            = 129
 
+# Per-lane results of the SFF-8636 cable diagnostics
+SFF8636_DIAG_HI_RXPWR = tuple('Hi RxPwr(L{0})'.format(lane + 1) for lane in range(4))
+SFF8636_DIAG_LO_RXPWR = tuple('Lo RxPwr(L{0})'.format(lane + 1) for lane in range(4))
+SFF8636_DIAG_HI_TXPWR = tuple('Hi TxPwr(L{0})'.format(lane + 1) for lane in range(4))
+SFF8636_DIAG_LO_TXPWR = tuple('Lo TxPwr(L{0})'.format(lane + 1) for lane in range(4))
+
+# Offsets of the cable diagnostics words in the SFF-8472 A2h block and in
+# the SFF-8636 page 03h thresholds
+SFF8472_DIAG_BLOCK_SIZE           = SFF8472_DOM_RXPWR_ADDR + 2 - SFF8472_DOM_ADDR
+SFF8472_DIAG_TEMP_OFFSET          = SFF8472_DOM_TEMP_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_TEMP_WARM_HI_OFFSET  = SFF8472_DOM_TEMP_WARM_HI_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_TEMP_WARM_LO_OFFSET  = SFF8472_DOM_TEMP_WARM_LO_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_VOLT_OFFSET          = SFF8472_DOM_VOLT_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_VOLT_WARM_HI_OFFSET  = SFF8472_DOM_VOLT_WARM_HI_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_VOLT_WARM_LO_OFFSET  = SFF8472_DOM_VOLT_WARM_LO_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_RXPWR_OFFSET         = SFF8472_DOM_RXPWR_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_RXPWR_WARM_HI_OFFSET = SFF8472_DOM_RXPWR_WARM_HI_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_RXPWR_WARM_LO_OFFSET = SFF8472_DOM_RXPWR_WARM_LO_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_TXPWR_OFFSET         = SFF8472_DOM_TXPWR_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_TXPWR_WARM_HI_OFFSET = SFF8472_DOM_TXPWR_WARM_HI_ADDR - SFF8472_DOM_ADDR
+SFF8472_DIAG_TXPWR_WARM_LO_OFFSET = SFF8472_DOM_TXPWR_WARM_LO_ADDR - SFF8472_DOM_ADDR
+SFF8636_DIAG_TEMP_WARM_HI_OFFSET  = SFF8636_DOM_TEMP_WARM_HI_ADDR - SFF8636_DOM_THRES_ADDR
+SFF8636_DIAG_TEMP_WARM_LO_OFFSET  = SFF8636_DOM_TEMP_WARM_LO_ADDR - SFF8636_DOM_THRES_ADDR
+SFF8636_DIAG_VOLT_WARM_HI_OFFSET  = SFF8636_DOM_VOLT_WARM_HI_ADDR - SFF8636_DOM_THRES_ADDR
+SFF8636_DIAG_VOLT_WARM_LO_OFFSET  = SFF8636_DOM_VOLT_WARM_LO_ADDR - SFF8636_DOM_THRES_ADDR
+SFF8636_DIAG_RXPWR_WARM_HI_OFFSET = SFF8636_DOM_RXPWR_WARM_HI_ADDR - SFF8636_DOM_THRES_ADDR
+SFF8636_DIAG_RXPWR_WARM_LO_OFFSET = SFF8636_DOM_RXPWR_WARM_LO_ADDR - SFF8636_DOM_THRES_ADDR
+SFF8636_DIAG_TXPWR_WARM_HI_OFFSET = SFF8636_DOM_TXPWR_WARM_HI_ADDR - SFF8636_DOM_THRES_ADDR
+SFF8636_DIAG_TXPWR_WARM_LO_OFFSET = SFF8636_DOM_TXPWR_WARM_LO_ADDR - SFF8636_DOM_THRES_ADDR
+
+# Virtual Cable Tester (1000BASE-T) results, by the status and length codes
+VCT_STATUS_MAP = ('OK', 'SHORT', 'OPEN', 'FAILED')
+VCT_LENGTH_MAP = ('< 50m',  '50 - 80m', '80 - 110m', '110 - 140m',
+                  '> 140m', '> 140m',   '> 140m',    '> 140m')
+
 # CMIS 4.0/5.0 specs have similar EEPROM bit offsets
 # QSFP-DD/QSFP56
 CMIS_CONNECTOR_ADDR             = 203
+CMIS_MEDIA_TYPE_ADDR            = 85
+CMIS_MEDIA_TYPE_PASSIVE_COPPER  = 0x03
 CMIS_IMPL_MEM_PAGES_ADDR        = ((142 & 0x7f) | 0x100)
 CMIS_PAGE_SIZE                  = 128
 CMIS_PAGE_ADDR_00h              = ((0 + 1) << 7)
@@ -132,6 +332,21 @@ CMIS_DOM_THRES_MODULE_OFFSET    = 0
 CMIS_DOM_THRES_CHANNEL_OFFSET   = 48
 CMIS_CHECKSUM                   = 222
 CMIS_CHECKSUM_START             = 129
+# Module monitors of the lower page, lane monitors of page 11h
+CMIS_DOM_TEMP_ADDR              = 14
+CMIS_DOM_TXPWR_OFFSET           = (154 & 0x7f)
+CMIS_DOM_TXBIAS_OFFSET          = (170 & 0x7f)
+CMIS_DOM_RXPWR_OFFSET           = (186 & 0x7f)
+# inf8628Dom field names of the TX power, TX bias and RX power of each lane
+CMIS_DOM_LANE_FIELDS            = tuple(('TX{}Power'.format(i), 'TX{}Bias'.format(i), 'RX{}Power'.format(i))
+                                        for i in range(1, 9))
+# Order of the four limits of each page 02h threshold
+CMIS_THRES_LEVELS               = ('HighAlarm', 'LowAlarm', 'HighWarning', 'LowWarning')
+# Diag status keys of the page 14h BER and SNR results, host lanes then media lanes
+CMIS_DIAG_BER_KEYS              = tuple('diag_host_ber{}'.format(i) for i in range(1, 9)) + \
+                                  tuple('diag_media_ber{}'.format(i) for i in range(1, 9))
+CMIS_DIAG_SNR_KEYS              = tuple('diag_host_snr{}'.format(i) for i in range(1, 9)) + \
+                                  tuple('diag_media_snr{}'.format(i) for i in range(1, 9))
 
 MOD_FLAGS_ADDR                   = 3
 MOD_POWER_ADDR                   = 26
@@ -148,8 +363,187 @@ MIS2_DOM_THRES_ADDR             = MIS2_PAGE_ADDR_01h
 MIS2_DOM_THRES_MODULE_OFFSET    = 49
 MIS2_DOM_THRES_CHANNEL_OFFSET   = 81
 
+# Threshold info layout per EEPROM type: (address, size, module offset,
+# channel offset, module keys, channel keys). The SFF-8472 thresholds are a
+# single table, decoded once for both the module and the channel keys.
+DOM_THRES_SPECS = {
+    XCVR_EEPROM_TYPE_QSFPDD: (CMIS_DOM_THRES_ADDR, 128, CMIS_DOM_THRES_MODULE_OFFSET,
+                              CMIS_DOM_THRES_CHANNEL_OFFSET, DOM_THRES_MODULE_KEYS, DOM_THRES_CHANNEL_KEYS),
+    XCVR_EEPROM_TYPE_QSFP56: (CMIS_DOM_THRES_ADDR, 128, CMIS_DOM_THRES_MODULE_OFFSET,
+                              CMIS_DOM_THRES_CHANNEL_OFFSET, DOM_THRES_MODULE_KEYS, DOM_THRES_CHANNEL_KEYS),
+    XCVR_EEPROM_TYPE_QSFP:   (SFF8636_DOM_THRES_ADDR, 128, SFF8636_DOM_THRES_MODULE_OFFSET,
+                              SFF8636_DOM_THRES_CHANNEL_OFFSET, DOM_THRES_MODULE_KEYS, DOM_THRES_CHANNEL_KEYS),
+    XCVR_EEPROM_TYPE_SFP:    (SFF8472_DOM_THRES_ADDR, 40, 0,
+                              0, SFF8472_DOM_THRES_MODULE_KEYS, SFF8472_DOM_THRES_CHANNEL_KEYS),
+    XCVR_EEPROM_TYPE_SFPDD:  (MIS2_DOM_THRES_ADDR, 128, MIS2_DOM_THRES_MODULE_OFFSET,
+                              MIS2_DOM_THRES_CHANNEL_OFFSET, DOM_THRES_MODULE_KEYS, DOM_THRES_CHANNEL_KEYS),
+}
+
 SFP_EEPROM_MANDATORY_FIELD_OFFSET_LIMIT = 256
 
+# EEPROM read retry budget, in seconds. The delay between retries starts at
+# EEPROM_READ_RETRY_DELAY_MIN and doubles up to EEPROM_READ_RETRY_DELAY_MAX.
+EEPROM_READ_RETRY_TIMEOUT   = 0.030
+EEPROM_READ_RETRY_DELAY_MIN = 0.002
+EEPROM_READ_RETRY_DELAY_MAX = 0.010
+
+# Time budget, in seconds, for the module to refresh the CMIS/MIS page 14h
+# diagnostic results once a new selector is written. The poll interval starts
+# at DIAG_RESULT_POLL_MIN and doubles up to DIAG_RESULT_POLL_MAX.
+DIAG_RESULT_TIMEOUT         = 1.0
+DIAG_RESULT_POLL_MIN        = 0.010
+DIAG_RESULT_POLL_MAX        = 0.100
+
+# Time budget, in seconds, for the module to get ready for a cable diagnostic.
+# The poll interval starts at DIAG_READY_POLL_MIN and doubles up to
+# DIAG_READY_POLL_MAX.
+DIAG_READY_TIMEOUT          = 10.0
+DIAG_READY_POLL_MIN         = 0.005
+DIAG_READY_POLL_MAX         = 0.100
+
+# Time, in seconds, the result of a completed 1000BASE-T cable test is reused
+# for, instead of running the test again
+VCT_RESULT_HOLD             = 5.0
+
+# Static EEPROM regions read along with the EEPROM cache, per port type,
+# including the DOM thresholds. The first region is always the one starting
+# at offset 0. The other ones are optional, e.g. on the flat memory modules.
+EEPROM_CACHE_REGIONS_CMIS      = [(0, 384), (0xa00, 32), (CMIS_DOM_THRES_ADDR, 128)]
+EEPROM_CACHE_REGIONS_QSFP      = [(0, 256), (SFF8636_DOM_THRES_ADDR, 128)]
+EEPROM_CACHE_REGIONS_SFP       = [(0, 128), (SFF8472_DOM_THRES_ADDR, 40)]
+
+# HEX string of every byte value
+HEX_BYTE_STRINGS = ["{0:0{1}x}".format(b, 2) for b in range(256)]
+
+# Big-endian DOM word decoders, unsigned and two's complement
+_U16 = struct.Struct('>H').unpack_from
+_S16 = struct.Struct('>h').unpack_from
+
+# Monitors checked by the SFF-8472 cable diagnostics, in order: (decoder,
+# value offset, high warning offset, low warning offset, low result, high
+# result, whether the test is 'Not Supported' without the thresholds)
+SFF8472_DIAG_CHECKS = (
+    (_S16, SFF8472_DIAG_TEMP_OFFSET,  SFF8472_DIAG_TEMP_WARM_HI_OFFSET,
+     SFF8472_DIAG_TEMP_WARM_LO_OFFSET,  'Lo TEMP',  'Hi TEMP',  True),
+    (_U16, SFF8472_DIAG_VOLT_OFFSET,  SFF8472_DIAG_VOLT_WARM_HI_OFFSET,
+     SFF8472_DIAG_VOLT_WARM_LO_OFFSET,  'Lo VOLT',  'Hi VOLT',  True),
+    (_U16, SFF8472_DIAG_RXPWR_OFFSET, SFF8472_DIAG_RXPWR_WARM_HI_OFFSET,
+     SFF8472_DIAG_RXPWR_WARM_LO_OFFSET, 'Lo RxPwr', 'Hi RxPwr', False),
+    (_U16, SFF8472_DIAG_TXPWR_OFFSET, SFF8472_DIAG_TXPWR_WARM_HI_OFFSET,
+     SFF8472_DIAG_TXPWR_WARM_LO_OFFSET, 'Lo TxPwr', 'Hi TxPwr', False),
+)
+# Module monitors checked by the SFF-8636 cable diagnostics, the test is
+# 'Not Supported' without their thresholds: (decoder, lower page address,
+# high warning offset, low warning offset, low result, high result)
+SFF8636_DIAG_CHECKS = (
+    (_S16, SFF8636_DOM_TEMP_ADDR, SFF8636_DIAG_TEMP_WARM_HI_OFFSET,
+     SFF8636_DIAG_TEMP_WARM_LO_OFFSET, 'Lo TEMP', 'Hi TEMP'),
+    (_U16, SFF8636_DOM_VOLT_ADDR, SFF8636_DIAG_VOLT_WARM_HI_OFFSET,
+     SFF8636_DIAG_VOLT_WARM_LO_OFFSET, 'Lo VOLT', 'Hi VOLT'),
+)
+# Lane monitors checked by the SFF-8636 cable diagnostics: (lower page
+# address of lane 1, high warning offset, low warning offset, low results,
+# high results)
+SFF8636_DIAG_LANE_CHECKS = (
+    (SFF8636_DOM_RXPWR_ADDR, SFF8636_DIAG_RXPWR_WARM_HI_OFFSET, SFF8636_DIAG_RXPWR_WARM_LO_OFFSET,
+     SFF8636_DIAG_LO_RXPWR, SFF8636_DIAG_HI_RXPWR),
+    (SFF8636_DOM_TXPWR_ADDR, SFF8636_DIAG_TXPWR_WARM_HI_OFFSET, SFF8636_DIAG_TXPWR_WARM_LO_OFFSET,
+     SFF8636_DIAG_LO_TXPWR, SFF8636_DIAG_HI_TXPWR),
+)
+
+def _hex_list(buf):
+    """
+    Convert raw EEPROM bytes into the HEX string list used by the SFF parsers
+    """
+    hex_str = buf.hex()
+    return [hex_str[i:i+2] for i in range(0, len(hex_str), 2)]
+
+def _verify_cmis_cc(raw, id1, id2):
+    """
+    Validate the CMIS check code, taking either identifier as the one in use
+    """
+    chk = sum(raw[CMIS_CHECKSUM_START:CMIS_CHECKSUM])
+    cc = raw[CMIS_CHECKSUM]
+    return ((chk + id1) & 0xff) == cc or ((chk + id2) & 0xff) == cc
+
+def _verify_sff8636_cc(raw, id1, id2):
+    """
+    Validate the SFF-8636 base check code, taking either identifier as the one in use
+    """
+    chk = sum(raw[SFF8636_CC_BASE_START:SFF8636_CC_BASE])
+    cc = raw[SFF8636_CC_BASE]
+    return ((chk + id1) & 0xff) == cc or ((chk + id2) & 0xff) == cc
+
+def _dom_power_str(raw):
+    """
+    Format a power monitor (units of 0.1uW) in dBm, the same way as the SFF parsers
+    """
+    mw = raw * 0.0001
+    if mw == 0:
+        return '-inf'
+    return '%.4f%s' % (10.0 * math.log10(mw), 'dBm')
+
+def _cmis_dom_data(lower_raw, page11_raw):
+    """
+    Decode the CMIS monitors straight from the raw lower page and page 11h,
+    into the same fields and formats as inf8628Dom
+    """
+    temp, vcc = struct.unpack_from('>hH', lower_raw, CMIS_DOM_TEMP_ADDR)
+    tx_power = struct.unpack_from('>8H', page11_raw, CMIS_DOM_TXPWR_OFFSET)
+    tx_bias = struct.unpack_from('>8H', page11_raw, CMIS_DOM_TXBIAS_OFFSET)
+    rx_power = struct.unpack_from('>8H', page11_raw, CMIS_DOM_RXPWR_OFFSET)
+
+    data = {'Temperature': '%.4fC' % (temp / 256.0),
+            'Vcc': '%.4fVolts' % (vcc * 0.0001)}
+    for lane, fields in enumerate(CMIS_DOM_LANE_FIELDS):
+        data[fields[0]] = _dom_power_str(tx_power[lane])
+        data[fields[1]] = '%.4fmA' % (tx_bias[lane] * 0.002)
+        data[fields[2]] = _dom_power_str(rx_power[lane])
+    return data
+
+def _cmis_thres_data(page02_raw, module_offset, channel_offset):
+    """
+    Decode the CMIS page 02h thresholds straight from the raw bytes, into the
+    same fields and formats as the inf8628Dom threshold parsers
+    """
+    temp = struct.unpack_from('>4h', page02_raw, module_offset)
+    vcc = struct.unpack_from('>4H', page02_raw, module_offset + 8)
+    tx_power = struct.unpack_from('>4H', page02_raw, channel_offset)
+    tx_bias = struct.unpack_from('>4H', page02_raw, channel_offset + 8)
+    rx_power = struct.unpack_from('>4H', page02_raw, channel_offset + 16)
+
+    data = {}
+    for i, level in enumerate(CMIS_THRES_LEVELS):
+        data['Temp' + level] = '%.4fC' % (temp[i] / 256.0)
+        data['Vcc' + level] = '%.4fVolts' % (vcc[i] * 0.0001)
+        data['TxPower' + level] = _dom_power_str(tx_power[i])
+        data['TxBias' + level] = '%.4fmA' % (tx_bias[i] * 0.002)
+        data['RxPower' + level] = _dom_power_str(rx_power[i])
+    return data
+
+def _cmis_ber_str(val):
+    """
+    Format a page 14h BER value (F16, 5-bit exponent and 11-bit mantissa) as
+    inf8628Diag.calc_ber does
+    """
+    exp = val >> 11
+    msa = val & 0x7ff
+    if msa == 0:
+        return "0"
+    elif msa >= 1000:
+        return "{0}E{1:+}".format(msa / 1000.0, exp - 21)
+    elif msa >= 100:
+        return "{0}E{1:+}".format(msa / 100.0, exp - 22)
+    elif msa >= 10:
+        return "{0}E{1:+}".format(msa / 10.0, exp - 23)
+    return "{0}E{1:+}".format(msa, exp - 24)
+
+def _cmis_snr_str(val):
+    """
+    Format a page 14h SNR value (units of 1/256 dB) as inf8628Diag.calc_snr does
+    """
+    return "0" if val == 0 else "{0:.1f}".format(val / 256.0)
+
 class SfpStandard(SfpBase):
     """
     Abstract base class for interfacing with a SFP module
@@ -167,16 +561,44 @@ class SfpStandard(SfpBase):
 
     MIS_REG_REV = 1
 
+    # Cross-check the raw CMIS DOM and threshold decoding against inf8628Dom,
+    # and log any field that differs
+    CMIS_DOM_PARSER_CHECK = False
+
     PORT_TYPE_NONE = 0
     PORT_TYPE_SFP = 1
     PORT_TYPE_QSFP = 2
     PORT_TYPE_QSFPDD = 3
     PORT_TYPE_SFPDD = 4
 
+    # Sysfs EEPROM read file descriptors, keyed by EEPROM path and shared by
+    # all the SFP objects and threads of the process. os.pread() does not use
+    # the file offset, so a single fd per path serves concurrent readers.
+    # Each entry is [fd, number of readers, stale]. A closed entry is only
+    # marked stale, and the last reader closes the fd, so that its number
+    # cannot be reused by another open while a read is still in flight.
+    _eeprom_rd_fds = {}
+    _eeprom_rd_fds_lock = threading.Lock()
+
     def __init__(self):
         SfpBase.__init__(self)
         self.eeprom_lock = Lock()
         self.eeprom_cache = None
+        self.eeprom_cache_pages = None
+        # sysfs EEPROM write file descriptor, opened on first use and kept
+        # open. Reads need no serialization, and go through the shared read fds
+        # without the EEPROM lock.
+        self._eeprom_wr_fd = None
+        # Last parsed interface ID: (parser class, EEPROM bytes, object, data)
+        self._parsed_id = None
+        # Bumped by clear_eeprom_cache() on every module change
+        self._eeprom_generation = 0
+        # Transceiver info of the current module: (EEPROM generation, info dict)
+        self._info_cache = None
+        # Last completed cable test: (monotonic time, result dict)
+        self._vct_last = None
+        # Per-thread snapshot of the lower 256 bytes, see enable_eeprom_read_cache()
+        self._read_cache = threading.local()
 
     @abc.abstractproperty
     def port_index(self):
@@ -190,6 +612,158 @@ class SfpStandard(SfpBase):
     def eeprom_path(self):
         pass
 
+    def __acquire_eeprom_rd_fd(self):
+        """
+        Take a reference on the shared sysfs EEPROM read file descriptor,
+        opened on first use
+
+        Returns:
+            The fd entry, to be passed to __release_eeprom_rd_fd()
+        """
+        path = self.eeprom_path
+        SfpStandard._eeprom_rd_fds_lock.acquire()
+        try:
+            entry = SfpStandard._eeprom_rd_fds.get(path)
+            if entry is None:
+                entry = [os.open(path, os.O_RDONLY | os.O_CLOEXEC), 0, False]
+                SfpStandard._eeprom_rd_fds[path] = entry
+            entry[1] += 1
+        finally:
+            SfpStandard._eeprom_rd_fds_lock.release()
+        return entry
+
+    @staticmethod
+    def __release_eeprom_rd_fd(entry):
+        """
+        Drop a reference taken by __acquire_eeprom_rd_fd(), closing the fd if
+        it is stale and this was the last reader
+        """
+        SfpStandard._eeprom_rd_fds_lock.acquire()
+        entry[1] -= 1
+        last = entry[2] and (entry[1] == 0)
+        SfpStandard._eeprom_rd_fds_lock.release()
+        if last:
+            try:
+                os.close(entry[0])
+            except OSError:
+                pass
+
+    def __close_eeprom_rd_fd(self):
+        """
+        Close the shared sysfs EEPROM read file descriptor for all its users,
+        the next read opens a new one. The fd itself is closed once the
+        readers still using it are done.
+        """
+        SfpStandard._eeprom_rd_fds_lock.acquire()
+        entry = SfpStandard._eeprom_rd_fds.pop(self.eeprom_path, None)
+        last = False
+        if entry is not None:
+            entry[2] = True
+            last = (entry[1] == 0)
+        SfpStandard._eeprom_rd_fds_lock.release()
+        if last:
+            try:
+                os.close(entry[0])
+            except OSError:
+                pass
+
+    def __close_eeprom_fds(self):
+        """
+        Close the cached sysfs EEPROM file descriptors, the EEPROM lock must
+        be held
+        """
+        self.__close_eeprom_rd_fd()
+        if self._eeprom_wr_fd is not None:
+            try:
+                os.close(self._eeprom_wr_fd)
+            except OSError:
+                pass
+        self._eeprom_wr_fd = None
+
+    def __parse_interface_id(self, id_class, raw):
+        """
+        Parse the interface ID fields of the raw EEPROM bytes, reusing the
+        previous result when the same parser already ran on the same bytes
+
+        Returns:
+            A tuple of the parser object and its get_data_pretty() output
+        """
+        raw_bytes = bytes(raw)
+        parsed = self._parsed_id
+        if (parsed is not None) and (parsed[0] is id_class) and (parsed[1] == raw_bytes):
+            return parsed[2], parsed[3]
+
+        sfpi_obj = id_class(_hex_list(raw))
+        sfp_data = sfpi_obj.get_data_pretty()
+        self._parsed_id = (id_class, raw_bytes, sfpi_obj, sfp_data)
+        return sfpi_obj, sfp_data
+
+    # Read out several regions with a single open of the sysfs file
+    def __read_eeprom_ranges(self, ranges):
+        """
+        read eeprom specfic regions, each beginning from a random offset with its own size
+
+        Args:
+             ranges :
+                     List of (offset, num_bytes) tuples
+
+        Returns:
+            list, one entry per region: a bytearray read from that region,
+                  or None if that region could not be read
+            None, if the module is absent
+        """
+        if not self.get_presence():
+            return None
+
+        bufs = []
+        # Reference on the shared read fd, held across all the regions
+        entry = None
+
+        try:
+            for offset, num_bytes in ranges:
+                buf = None
+
+                # Read retry logic to handle EEPROM read failures. The deadline is
+                # taken before the first attempt, and one last attempt is always
+                # made once the deadline has passed.
+                deadline = time.monotonic() + EEPROM_READ_RETRY_TIMEOUT
+                retry_interval = EEPROM_READ_RETRY_DELAY_MIN
+
+                while True:
+                    try:
+                        if entry is None:
+                            entry = self.__acquire_eeprom_rd_fd()
+                        buf = os.pread(entry[0], num_bytes, offset)
+                        break
+                    except IOError as ex:
+                        # The device is gone, reopen it on the next attempt
+                        if (entry is not None) and (ex.errno in (errno.ENXIO, errno.ENODEV)):
+                            self.__close_eeprom_rd_fd()
+                            self.__release_eeprom_rd_fd(entry)
+                            entry = None
+                        #If offset consists of crucial data, retry reading EEPROM
+                        if offset < SFP_EEPROM_MANDATORY_FIELD_OFFSET_LIMIT and \
+                            (offset + num_bytes) <= SFP_EEPROM_MANDATORY_FIELD_OFFSET_LIMIT:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                break
+                            time.sleep(min(retry_interval, remaining))
+                            retry_interval = min(retry_interval * 2, EEPROM_READ_RETRY_DELAY_MAX)
+                        else:
+                            #If non crucial data, do not perform read retry's
+                            break
+
+                if buf is None:
+                    bufs.append(None)
+                    continue
+
+                bufs.append(bytearray(buf.ljust(num_bytes, b'\x00')))
+        finally:
+            if entry is not None:
+                self.__release_eeprom_rd_fd(entry)
+
+        return bufs
+
     # Read out any bytes from any offset
     def __read_eeprom(self, offset, num_bytes):
         """
@@ -205,57 +779,10 @@ class SfpStandard(SfpBase):
             bytearray, if raw sequence of bytes are read correctly from the offset of size num_bytes
             None, if the read_eeprom fails
         """
-        buf = None
-        eeprom_raw = []
-        sysfs_sfp_i2c_client_eeprom_path = self.eeprom_path
-
-        if not self.get_presence():
-            return None
-
-        # Read retry logic to handle EEPROM read failures
-        retry_expiry = 4  # Counter to retry for 1 second
-        retry_interval = 0.25  # Delay between retries in seconds
-
-        retry_count = 0
-
-        sysfsfile_eeprom = None
-
-        while retry_count < retry_expiry:
-            try:
-                if not sysfsfile_eeprom:
-                    # Open the file only if it's not already open
-                    sysfsfile_eeprom = open(sysfs_sfp_i2c_client_eeprom_path, "rb", 0)
-                sysfsfile_eeprom.seek(offset)
-                buf = sysfsfile_eeprom.read(num_bytes)
-                break
-            except IOError as ex:
-                #If offset consists of crucial data, retry reading EEPROM
-                if offset < SFP_EEPROM_MANDATORY_FIELD_OFFSET_LIMIT and \
-                    (offset + num_bytes) <= SFP_EEPROM_MANDATORY_FIELD_OFFSET_LIMIT:
-                    time.sleep(retry_interval)  # Sleep 250ms before retrying
-                    retry_count += 1
-                else:
-                    #If non crucial data, do not perform read retry's
-                    break
-
-        if sysfsfile_eeprom is not None:
-            sysfsfile_eeprom.close()
-
-        if buf is None:
+        bufs = self.__read_eeprom_ranges([(offset, num_bytes)])
+        if bufs is None:
             return None
-
-        # Python3: The returned buf is a int[]
-        # Python2: The returned buf is a str[]
-        # TODO: Remove this check once we no longer support Python 2
-        if sys.version_info >= (3, 0):
-            for x in buf:
-                eeprom_raw.append(x)
-        else:
-            for x in buf:
-                eeprom_raw.append(ord(x))
-        while len(eeprom_raw) < num_bytes:
-            eeprom_raw.append(0)
-        return eeprom_raw
+        return bufs[0]
 
     # Read out any bytes from any offset
     def read_eeprom(self, offset, num_bytes):
@@ -272,10 +799,29 @@ class SfpStandard(SfpBase):
             bytearray, if raw sequence of bytes are read correctly from the offset of size num_bytes
             None, if the read_eeprom fails
         """
-        self.eeprom_lock.acquire()
-        bytes = self.__read_eeprom(offset, num_bytes)
-        self.eeprom_lock.release()
-        return bytes
+        if getattr(self._read_cache, 'enabled', False) and (offset + num_bytes) <= 256:
+            if self._read_cache.lower is None:
+                self._read_cache.lower = self.__read_eeprom(0, 256)
+            if self._read_cache.lower is not None:
+                return self._read_cache.lower[offset:(offset + num_bytes)]
+        return self.__read_eeprom(offset, num_bytes)
+
+    def enable_eeprom_read_cache(self):
+        """
+        Serve the reads of the lower 256 bytes issued by the calling thread from
+        a single snapshot of them, taken on the first such read, until
+        disable_eeprom_read_cache() is called. Meant to bracket back-to-back
+        status queries of a port, e.g. DOM and diagnostics
+        """
+        self._read_cache.enabled = True
+        self._read_cache.lower = None
+
+    def disable_eeprom_read_cache(self):
+        """
+        Go back to reading the lower 256 bytes from the module on every access
+        """
+        self._read_cache.enabled = False
+        self._read_cache.lower = None
 
     def __write_eeprom(self, offset, num_bytes, write_buffer):
         """
@@ -297,23 +843,20 @@ class SfpStandard(SfpBase):
         if not self.get_presence():
             return False
 
-        sysfsfile_eeprom = None
+        # The lower page snapshot no longer matches the module
+        if offset < 256:
+            self._read_cache.lower = None
+
         try:
-            sysfsfile_eeprom = open(sysfs_sfp_i2c_client_eeprom_path, "wb", 0)
-            sysfsfile_eeprom.seek(offset)
-            # TODO: Remove this check once we no longer support Python 2
-            if sys.version_info >= (3, 0):
-                for i in range(num_bytes):
-                    sysfsfile_eeprom.write(write_buffer[i].to_bytes(1, "little"))
-            else:
-                for i in range(num_bytes):
-                    sysfsfile_eeprom.write(chr(write_buffer[i]))
+            if self._eeprom_wr_fd is None:
+                self._eeprom_wr_fd = os.open(sysfs_sfp_i2c_client_eeprom_path,
+                                             os.O_WRONLY | os.O_CLOEXEC)
+            os.pwrite(self._eeprom_wr_fd, bytes(bytearray(write_buffer[:num_bytes])), offset)
         except Exception as ex:
+            if isinstance(ex, OSError) and ex.errno in (errno.ENXIO, errno.ENODEV):
+                self.__close_eeprom_fds()
             syslog.syslog(syslog.LOG_ERR, "port {0}: {1}: offset {2}: write failed: {3} ".format(self.port_index, sysfs_sfp_i2c_client_eeprom_path, hex(offset), ex))
             return False
-        finally:
-            if sysfsfile_eeprom is not None:
-                sysfsfile_eeprom.close()
 
         return True
 
@@ -339,38 +882,62 @@ class SfpStandard(SfpBase):
         return ret
 
     def modify_eeprom_byte(self, offset, value, mask=0xff):
-        buf = self.read_eeprom(offset, 1)
+        """
+        Update the bits selected by mask of one EEPROM byte. The read and the
+        write are done under a single hold of the EEPROM lock, so that a
+        concurrent writer cannot interleave with them.
+
+        Returns:
+            a Boolean, true if the byte holds the requested bits on return
+        """
+        self.eeprom_lock.acquire()
+        buf = self.__read_eeprom(offset, 1)
         if buf is None or len(buf) < 1:
-            return False
-        old = buf[0]
-        new = value & mask
-        ret = True
-        if new != old & mask:
-            buf = bytearray([(old & ~mask) | new])
-            ret = self.write_eeprom(offset, 1, buf)
+            ret = False
+        else:
+            old = buf[0]
+            new = value & mask
+            ret = True
+            if new != old & mask:
+                ret = self.__write_eeprom(offset, 1, [(old & ~mask) | new])
+        self.eeprom_lock.release()
         return ret
 
     def get_module_type(self):
         buf = self.get_eeprom_cache_raw(0,1)
-        return buf[0] if len(buf) > 0 else 0
+        return buf[0] if buf else 0
 
     def get_module_type_raw(self):
         mt = self.get_module_type()
-        return "{0:0{1}x}".format(mt, 2)
+        return HEX_BYTE_STRINGS[mt]
 
     def get_eeprom_raw(self, offset = 0, num_bytes = 256):
+        """
+        Read EEPROM bytes for the callers expecting the SFF parsers input
+        The buffer returned is in HEX string format, use read_eeprom() for raw bytes
+        """
         buf = self.read_eeprom(offset, num_bytes)
 
         if buf is None:
             return None
-        eeprom_raw = []
-        for n in range(len(buf)):
-            eeprom_raw.append("{0:0{1}x}".format(buf[n], 2))
-        while len(eeprom_raw) < num_bytes:
-            eeprom_raw.append("00")
+        eeprom_raw = _hex_list(buf)
+        if len(eeprom_raw) < num_bytes:
+            eeprom_raw.extend(["00"] * (num_bytes - len(eeprom_raw)))
         return eeprom_raw
 
     def get_eeprom_type(self, eeprom_ifraw = None):
+        """
+        Detect the EEPROM layout of the module
+
+        Args:
+             eeprom_ifraw:
+                     bytearray, raw EEPROM contents starting from offset 0.
+                     The identifier bytes of modules with a broken identifier
+                     are corrected in place.
+
+        Returns:
+            One of the XCVR_EEPROM_TYPE_* values
+        """
         type = XCVR_EEPROM_TYPE_UNKNOWN
 
         raw = eeprom_ifraw
@@ -385,27 +952,25 @@ class SfpStandard(SfpBase):
 
             id1 = raw[0]
             id2 = raw[128]
-            if id1 in SFF8024_TYPE_QSFP + SFF8024_TYPE_QSFPDD + \
-                SFF8024_TYPE_QSFP_CMIS_COMPLIANT:
+            if id1 in SFF8024_TYPE_QSFP_ANY_ID_SET:
                 id = id1
-            elif id2 in SFF8024_TYPE_QSFP + SFF8024_TYPE_QSFPDD + \
-                SFF8024_TYPE_QSFP_CMIS_COMPLIANT:
+            elif id2 in SFF8024_TYPE_QSFP_ANY_ID_SET:
                 id = id2
             # A special case of [Amphenol#NDAAFF-0001]
-            elif id1 == '05' and id2 == '01':
-                id = id1 = '11'
+            elif id1 == 0x05 and id2 == 0x01:
+                id = id1 = 0x11
             else:
-                id = SFF8024_TYPE_QSFP[0]
+                id = int(SFF8024_TYPE_QSFP[0], 16)
 
             try:
-                if id in SFF8024_TYPE_QSFPDD + SFF8024_TYPE_QSFP_CMIS_COMPLIANT:
-                    sfpi_obj = inf8628InterfaceId(raw)
-                    sfp_data = sfpi_obj.get_data_pretty()
+                if id in SFF8024_TYPE_CMIS_ID_SET:
+                    from .sonic_sfp.inf8628 import inf8628InterfaceId
+                    sfpi_obj, sfp_data = self.__parse_interface_id(inf8628InterfaceId, raw)
                     vend = sfp_data['data']['Vendor Name']
                     part = sfp_data['data']['Vendor Part Number']
                 else:
-                    sfpi_obj = sff8436InterfaceId(raw)
-                    sfp_data = sfpi_obj.get_data_pretty()
+                    from .sonic_sfp.sff8436 import sff8436InterfaceId
+                    sfpi_obj, sfp_data = self.__parse_interface_id(sff8436InterfaceId, raw)
                     vend = sfp_data['data']['Vendor Name']
                     part = sfp_data['data']['Vendor PN']
             except:
@@ -422,60 +987,39 @@ class SfpStandard(SfpBase):
                 return XCVR_EEPROM_TYPE_QSFPDD
 
             # QSFPDD check code validation
-            if id in SFF8024_TYPE_QSFPDD:
-                sum = 0
-                for i in range(CMIS_CHECKSUM_START, CMIS_CHECKSUM):
-                    sum += int(raw[i], 16)
-                if ((sum + int(id1, 16)) & 0xff) == int(raw[CMIS_CHECKSUM], 16) or \
-                   ((sum + int(id2, 16)) & 0xff) == int(raw[CMIS_CHECKSUM], 16):
+            if id in SFF8024_TYPE_QSFPDD_ID_SET:
+                if _verify_cmis_cc(raw, id1, id2):
                     type = XCVR_EEPROM_TYPE_OSFP
 
             # QSFP56 validation
-            if id in SFF8024_TYPE_QSFP_CMIS_COMPLIANT:
-                qsfp56_eeprom_identifiers = [
-                    (0x01, 0x0F, 0x0E, 0x44, 0x01),  #200G QSFP56 SR4
-                    (0x02, 0x0F, 0x18, 0x44, 0x01)   #200G QSFP56 FR4
-                    ]
-
-                byte85 = int(raw[85], 16)
-                byte86 = int(raw[86], 16)
-                byte87 = int(raw[87], 16)
-                byte88 = int(raw[88], 16)
-                byte89 = int(raw[89], 16)
-                eeprom_data = (byte85, byte86, byte87, byte88, byte89)
-                if eeprom_data in qsfp56_eeprom_identifiers:
+            if id in SFF8024_TYPE_QSFP_CMIS_COMPLIANT_ID_SET:
+                if bytes(raw[85:90]) in QSFP56_EEPROM_IDENTIFIERS:
                     type = XCVR_EEPROM_TYPE_QSFP56
 
             # QSFP28 check code validation (CC_BASE)
             if type == XCVR_EEPROM_TYPE_UNKNOWN:
                 # check if the media type is QSFP. SFP+/SFP28 may be connected
                 # in QSFP port using QSA28 Adapter.
-                if raw[0] in SFF8024_TYPE_QSFP:
-                    sum = 0
-                    for i in range(SFF8636_CC_BASE_START, SFF8636_CC_BASE):
-                        sum += int(raw[i], 16)
-                    if ((sum + int(id1, 16)) & 0xff) == int(raw[SFF8636_CC_BASE], 16) or \
-                       ((sum + int(id2, 16)) & 0xff) == int(raw[SFF8636_CC_BASE], 16):
+                if raw[0] in SFF8024_TYPE_QSFP_ID_SET:
+                    if _verify_sff8636_cc(raw, id1, id2):
                         type = XCVR_EEPROM_TYPE_QSFP
             if type != XCVR_EEPROM_TYPE_UNKNOWN:
                 raw[0] = raw[128] = id
             else:
-                sfpi_obj = sff8436InterfaceId(eeprom_ifraw)
-                sfp_data = sfpi_obj.get_data_pretty()
+                from .sonic_sfp.sff8436 import sff8436InterfaceId
+                sfpi_obj, sfp_data = self.__parse_interface_id(sff8436InterfaceId, raw)
                 # FIT ON TENG#U4DP34-0B001-EF, its checksum is totally broken
                 if 'FIT' in sfp_data['data']['Vendor Name'] and \
                    'U4DP34-0B001-EF' in sfp_data['data']['Vendor PN']:
                     raw[0] = raw[128] = id
                     type = XCVR_EEPROM_TYPE_QSFP
         if type == XCVR_EEPROM_TYPE_UNKNOWN:
-            if raw[0] in SFF8024_TYPE_SFPDD:
+            if raw[0] in SFF8024_TYPE_SFPDD_ID_SET:
                 type = XCVR_EEPROM_TYPE_SFPDD
             else:
                 # SFP check code validation (CC_BASE)
-                sum = 0
-                for i in range(SFF8472_CC_BASE_START, SFF8472_CC_BASE):
-                    sum += int(raw[i], 16)
-                if (sum & 0xff) == int(raw[SFF8472_CC_BASE], 16):
+                chk = sum(raw[SFF8472_CC_BASE_START:SFF8472_CC_BASE])
+                if (chk & 0xff) == raw[SFF8472_CC_BASE]:
                     type = XCVR_EEPROM_TYPE_SFP
         else:
             return type
@@ -487,19 +1031,46 @@ class SfpStandard(SfpBase):
         mtype = self.get_module_type_raw()
         if mtype in SFF8024_TYPE_SFP:
             code = self.get_eeprom_cache(SFF8472_CONNECTOR_ADDR, 1)
-        elif mtype in SFF8024_TYPE_QSFP:
+        elif mtype in SFF8024_TYPE_QSFP_SET:
             code = self.get_eeprom_cache(SFF8636_CONNECTOR_ADDR, 1)
-        elif mtype in SFF8024_TYPE_QSFPDD + SFF8024_TYPE_QSFP_CMIS_COMPLIANT:
+        elif mtype in SFF8024_TYPE_CMIS_SET:
             code = self.get_eeprom_cache(CMIS_CONNECTOR_ADDR, 1)
 
         if code is None or len(code) < 1:
             ctype = None
         else:
             ctype = connector_dict.get(code[0])
-        if ctype in ['Copper pigtail', 'No separable connector']:
+        if ctype in DAC_CONNECTOR_TYPES:
             return True
         return False
 
+    def __is_passive_copper(self):
+        """
+        Check if the module in this port is a passive copper cable, which has
+        no DOM. Active copper and optical cables are not matched.
+        """
+        mtype = self.get_module_type_raw()
+        if mtype in SFF8024_TYPE_SFP:
+            code = self.get_eeprom_cache_raw(SFF8472_CABLE_TECH_ADDR, 1)
+            return bool(code) and bool(code[0] & SFF8472_CABLE_TECH_PASSIVE)
+        if mtype in SFF8024_TYPE_QSFP_SET:
+            code = self.get_eeprom_cache_raw(SFF8636_DEVICE_TECH_ADDR, 1)
+            return bool(code) and (code[0] >> 4) in SFF8636_PASSIVE_COPPER_TECHS
+        if mtype in SFF8024_TYPE_CMIS_SET:
+            code = self.get_eeprom_cache_raw(CMIS_MEDIA_TYPE_ADDR, 1)
+            return bool(code) and code[0] == CMIS_MEDIA_TYPE_PASSIVE_COPPER
+        return False
+
+    def __is_sff8636(self):
+        """
+        Check if the module in this port follows the SFF-8636 memory map
+        """
+        if self.port_type == self.PORT_TYPE_QSFP:
+            return True
+        if self.port_type == self.PORT_TYPE_QSFPDD:
+            return self.get_module_type() not in SFF8024_TYPE_CMIS_ID_SET
+        return False
+
     def get_lpmode(self):
         """
         Retrieves the lpmode (low power mode) status of this SFP
@@ -508,15 +1079,7 @@ class SfpStandard(SfpBase):
         """
         lpmode = True
         try:
-            is_sff8636 = False
-            if self.port_type == self.PORT_TYPE_QSFP:
-                is_sff8636 = True
-            elif self.port_type == self.PORT_TYPE_QSFPDD:
-                module_type = self.get_module_type_raw()
-                if module_type not in SFF8024_TYPE_QSFPDD + \
-                    SFF8024_TYPE_QSFP_CMIS_COMPLIANT:
-                    is_sff8636 = True
-            if is_sff8636:
+            if self.__is_sff8636():
                 if self.__is_direct_attach_cable():
                     return True
                 buf = self.read_eeprom(SFF8636_PWR_CTRL_ADDR, 1)
@@ -539,16 +1102,7 @@ class SfpStandard(SfpBase):
         """
         ret = False
         try:
-            is_sff8636 = False
-            if self.port_type == self.PORT_TYPE_QSFP:
-                is_sff8636 = True
-            elif self.port_type == self.PORT_TYPE_QSFPDD:
-                module_type = self.get_module_type_raw()
-                if module_type not in SFF8024_TYPE_QSFPDD + \
-                    SFF8024_TYPE_QSFP_CMIS_COMPLIANT:
-                    is_sff8636 = True
-
-            if is_sff8636:
+            if self.__is_sff8636():
                 if self.__is_direct_attach_cable():
                     #print("\nSKIPPING DAC")
                     return True if lpmode else False
@@ -567,24 +1121,65 @@ class SfpStandard(SfpBase):
     def populate_eeprom_cache(self):
         """
         Per port EEPROM cache to avoid redudant EEPROM reads
-        EEPROM cache contents are in HEX string format
+        EEPROM cache contents are raw bytes (bytearray)
         """
         
         if self.eeprom_cache is None:
             if (self.port_type == self.PORT_TYPE_QSFPDD) or (self.port_type == self.PORT_TYPE_SFPDD):
-                eeprom_ifraw = self.get_eeprom_raw(0, 384)
+                regions = EEPROM_CACHE_REGIONS_CMIS
             elif self.port_type == self.PORT_TYPE_QSFP:
-                eeprom_ifraw = self.get_eeprom_raw(0, 256)
+                regions = EEPROM_CACHE_REGIONS_QSFP
             else:
-                eeprom_ifraw = self.get_eeprom_raw(0, 128)
+                regions = EEPROM_CACHE_REGIONS_SFP
+
+            bufs = self.__read_eeprom_ranges(regions)
+
+            if (bufs is None) or (bufs[0] is None):
+                return
 
-            self.eeprom_cache = eeprom_ifraw
+            self.eeprom_cache_pages = {}
+            for (offset, num_bytes), buf in zip(regions, bufs):
+                if buf is not None:
+                    self.eeprom_cache_pages[offset] = buf
+            self.eeprom_cache = self.eeprom_cache_pages[0]
+            self._parsed_id = None
+
+    def __get_eeprom_cache_bytes(self, offset, num_bytes):
+        """
+        Read a static EEPROM region as raw bytes, served from the regions
+        fetched by populate_eeprom_cache when possible
+        """
+        if self.eeprom_cache_pages is not None:
+            # Fast paths: the lower pages cache (e.g. the implemented memory
+            # pages byte), or a region starting at the requested offset
+            if (offset + num_bytes) <= len(self.eeprom_cache):
+                return self.eeprom_cache[offset:(offset + num_bytes)]
+            buf = self.eeprom_cache_pages.get(offset)
+            if (buf is not None) and (num_bytes <= len(buf)):
+                return buf[:num_bytes]
+
+            for base, buf in self.eeprom_cache_pages.items():
+                if base <= offset and (offset + num_bytes) <= (base + len(buf)):
+                    return buf[(offset - base):(offset - base + num_bytes)]
+        return self.read_eeprom(offset, num_bytes)
+
+    def __get_eeprom_cache_page(self, offset, num_bytes):
+        """
+        Read a static EEPROM region in HEX string format, see
+        __get_eeprom_cache_bytes
+        """
+        buf = self.__get_eeprom_cache_bytes(offset, num_bytes)
+        if buf is None:
+            return None
+        return _hex_list(buf)
 
     def get_eeprom_cache_raw(self, offset=0, length=0):
         """
         This routine returns SFP EEPROM contents in INT format
         Offset = 0 returns whole cache. Otherwise the buffer returned will start from the
         Offset upto the length of bytes that needs to be read
+        The buffer is a bytearray copy, so that the EEPROM cache contents are
+        not modified by the callers
         """
 
         buf = None
@@ -596,31 +1191,45 @@ class SfpStandard(SfpBase):
                           "Offset : {} ".format(self.port_index, offset))
             return None
 
-        # Convert EEPROM (HEX string) contents into HEX values. Before converting, copy
-        # the original cache so that the EEPROM cache contents are not modified
-        eeprom_bytes = self.eeprom_cache[:]
-        for i in range(len(eeprom_bytes)):
-            eeprom_bytes[i] = int(eeprom_bytes[i],16)
-
         if length == 0:
-            buf = eeprom_bytes[offset:]
+            buf = self.eeprom_cache[offset:]
         else:
-            buf = eeprom_bytes[offset:(offset+length)]
+            buf = self.eeprom_cache[offset:(offset+length)]
         return buf
 
 
     def clear_eeprom_cache(self):
         """
-        Clear EEPROM cache
+        Clear EEPROM cache, and close the sysfs EEPROM files so that they
+        are reopened for the next module
         """
         if self.eeprom_cache is not None:
             del self.eeprom_cache
             self.eeprom_cache = None
+        self.eeprom_cache_pages = None
+        self._parsed_id = None
+        self._eeprom_generation += 1
+        self._info_cache = None
+        self._vct_last = None
+        self.eeprom_lock.acquire()
+        self.__close_eeprom_fds()
+        self.eeprom_lock.release()
+
+    def get_eeprom_generation(self):
+        """
+        Retrieves the EEPROM generation, a counter bumped each time the EEPROM
+        cache is cleared, i.e. on every module change
+
+        Returns:
+            An integer, data derived from the EEPROM is still valid as long
+            as this value is unchanged
+        """
+        return self._eeprom_generation
 
     def get_eeprom_cache(self, offset=0, length=0):
         """
         Read EEPROM cache for SFP object
-        EEPROM cache contents are in HEX string format
+        The buffer returned is in HEX string format
         """
         buf = None
         if self.eeprom_cache is None:
@@ -631,11 +1240,210 @@ class SfpStandard(SfpBase):
                           "Offset : {}".format(self.port_index, offset))
         else:
             if length == 0:
-                buf = self.eeprom_cache[offset:]
+                buf = _hex_list(self.eeprom_cache[offset:])
             else:
-                buf = self.eeprom_cache[offset:(offset+length)]
+                buf = _hex_list(self.eeprom_cache[offset:(offset+length)])
         return buf
 
+    def __get_cmis_info(self, type, eeprom_raw, transceiver_info_dict):
+        """
+        Fill in the QSFP-DD/OSFP and QSFP56 (CMIS) specific transceiver info
+
+        Returns:
+            The parsed interface id data, or None if the EEPROM cannot be parsed
+        """
+        from .sonic_sfp.inf8628 import inf8628InterfaceId
+        sfpi_obj, sfp_data = self.__parse_interface_id(inf8628InterfaceId, self.eeprom_cache)
+        if sfpi_obj is None:
+            return None
+
+        for key in cmis_cable_length_types:
+            cable_length = sfp_data['data'].get(key)
+            if (cable_length is None) or (cable_length <= 0):
+                continue
+            transceiver_info_dict['cable_type'] = key
+            transceiver_info_dict['cable_length'] = str(cable_length)
+            break
+
+        app_adv_dict = sfp_data['data'].get('Application Advertisement')
+        if (app_adv_dict is not None) and len(app_adv_dict) > 0:
+            transceiver_info_dict['application_advertisement'] = str(app_adv_dict)
+
+        # Set the Max Speed based on the Media Type from EEPROM
+        if type == XCVR_EEPROM_TYPE_QSFP56:
+            # QSFP56 modules use 4 HW lanes and support 200G
+            transceiver_info_dict['xcvr_speed_max'] = '200000'
+        else:
+            # As of today, all the known QSFPDD modules support 400G
+            transceiver_info_dict['xcvr_speed_max'] = '400000'
+
+        # It's expected that PAGE1 could be unavailable
+        mem_page_raw = self.__get_eeprom_cache_page(CMIS_IMPL_MEM_PAGES_ADDR, 1)
+        if mem_page_raw is None:
+            mem_page_raw = ['00']
+
+        mem_page_data = sfpi_obj.parse_implemented_memory_pages(mem_page_raw, 0)
+        if mem_page_data is not None:
+            transceiver_info_dict['memory_pages'] = mem_page_data['data']['Implemented Memory Pages']['value']
+
+        if 'Diagnostic Pages Implemented' in transceiver_info_dict['memory_pages']:
+            diag_raw = self.__get_eeprom_cache_page(0xa00, 32)
+            if diag_raw is None:
+                return sfp_data
+            from .sonic_sfp.inf8628 import inf8628Diag
+            sfpd_obj = inf8628Diag(diag_raw)
+            if sfpd_obj is None:
+                return sfp_data
+            diag_data = sfpd_obj.get_data_pretty()
+            if diag_data is None:
+                return sfp_data
+            transceiver_info_dict['diag_caps_loopback'] = diag_data['data']['Loopback Capabilities']
+            transceiver_info_dict['diag_caps_pattern'] = diag_data['data']['General Pattern Capabilities']
+            transceiver_info_dict['diag_caps_pattern_gen_host'] = diag_data['data']['Pattern Generator Capabilities - Host']
+            transceiver_info_dict['diag_caps_pattern_gen_media'] = diag_data['data']['Pattern Generator Capabilities - Media']
+            transceiver_info_dict['diag_caps_pattern_chk_host'] = diag_data['data']['Pattern Checker Capabilities - Host']
+            transceiver_info_dict['diag_caps_pattern_chk_media'] = diag_data['data']['Pattern Checker Capabilities - Media']
+            transceiver_info_dict['diag_caps_report'] = diag_data['data']['Reporting Capabilities']
+
+        return sfp_data
+
+    def __get_sff8636_info(self, type, eeprom_raw, transceiver_info_dict):
+        """
+        Fill in the QSFP+/QSFP28 (SFF-8436/SFF-8636) specific transceiver info
+
+        Returns:
+            The parsed interface id data, or None if the EEPROM cannot be parsed
+        """
+        from .sonic_sfp.sff8436 import sff8436InterfaceId
+        sfpi_obj, sfp_data = self.__parse_interface_id(sff8436InterfaceId, self.eeprom_cache)
+        if sfpi_obj is None:
+            return None
+        eeprom_ifraw = _hex_list(eeprom_raw)
+        link_code = sfpi_obj.parse_link_code(eeprom_ifraw, 192)
+        if link_code in SFF8636_WAVELENGTH_LINK_CODES:
+            wavelength_data = sfpi_obj.parse_wavelength(eeprom_ifraw, 186)
+            transceiver_info_dict['wavelength'] = wavelength_data['data']['Wavelength']['value']
+
+        for key in qsfp_cable_length_types:
+            cable_length = sfp_data['data'].get(key)
+            if (cable_length is None) or (cable_length <= 0):
+                continue
+            transceiver_info_dict['cable_type'] = key
+            transceiver_info_dict['cable_length'] = str(cable_length)
+            break
+
+        compliance_code_dict = sfp_data['data'].get('Specification compliance')
+        if (compliance_code_dict is not None) and len(compliance_code_dict) > 0:
+            transceiver_info_dict['specification_compliance'] = str(compliance_code_dict)
+
+        eth_compliance = compliance_code_dict.get('10/40G Ethernet Compliance Code', '')
+        if '100G' in eth_compliance:
+            transceiver_info_dict['xcvr_speed_max'] = '100000'
+        else:
+            transceiver_info_dict['xcvr_speed_max'] = '40000'
+
+        return sfp_data
+
+    def __get_sff8472_info(self, type, eeprom_raw, transceiver_info_dict):
+        """
+        Fill in the SFP (SFF-8472) specific transceiver info
+
+        Returns:
+            The parsed interface id data, or None if the EEPROM cannot be parsed
+        """
+        from .sonic_sfp.sff8472 import sff8472InterfaceId
+        sfpi_obj, sfp_data = self.__parse_interface_id(sff8472InterfaceId, self.eeprom_cache)
+        if sfpi_obj is None:
+            return None
+
+        for key in sfp_cable_length_types:
+            cable_length = sfp_data['data'].get(key)
+            if (cable_length is None) or (cable_length <= 0):
+                continue
+            transceiver_info_dict['cable_type'] = key
+            transceiver_info_dict['cable_length'] = str(cable_length)
+            break
+
+        compliance_code_dict = sfp_data['data'].get('TransceiverCodes')
+        if (compliance_code_dict is not None) and len(compliance_code_dict) > 0:
+            transceiver_info_dict['specification_compliance'] = str(compliance_code_dict)
+
+        # An unknown rate ('N/A') is reported as the fastest SFP
+        nbr_s = sfp_data['data']['NominalSignallingRate(UnitsOf100Mbd)']
+        try:
+            nbr = int(nbr_s)
+        except (TypeError, ValueError):
+            nbr = 250
+        transceiver_info_dict['xcvr_speed_max'] = next(
+            (speed for min_nbr, speed in SFF8472_SPEED_MAX_BY_NBR if nbr >= min_nbr), '1000')
+
+        return sfp_data
+
+    def __get_mis_info(self, type, eeprom_raw, transceiver_info_dict):
+        """
+        Fill in the SFP-DD (MIS) specific transceiver info
+
+        Returns:
+            The parsed interface id data, or None if the EEPROM cannot be parsed
+        """
+        from .sonic_sfp.mis2 import mis2InterfaceId
+        sfpi_obj, sfp_data = self.__parse_interface_id(mis2InterfaceId, self.eeprom_cache)
+        if sfpi_obj is None:
+            return None
+
+        for key in mis_cable_length_types:
+            cable_length = sfp_data['data'].get(key)
+            if (cable_length is None) or (cable_length <= 0):
+                continue
+            transceiver_info_dict['cable_type'] = key
+            transceiver_info_dict['cable_length'] = str(cable_length)
+            break
+
+        app_adv_dict = sfp_data['data'].get('Application Advertisement')
+        if (app_adv_dict is not None) and len(app_adv_dict) > 0:
+            transceiver_info_dict['application_advertisement'] = str(app_adv_dict)
+
+        # As of today, all the known SFPDD modules support 100G
+        transceiver_info_dict['xcvr_speed_max'] = '100000'
+
+        # It's expected that PAGE1 could be unavailable
+        mem_page_raw = self.__get_eeprom_cache_page(MIS2_IMPL_MEM_PAGES_ADDR, 1)
+        if mem_page_raw is None:
+            mem_page_raw = ['00']
+
+        mem_page_data = sfpi_obj.parse_implemented_memory_pages(mem_page_raw, 0)
+        if mem_page_data is not None:
+            transceiver_info_dict['memory_pages'] = mem_page_data['data']['Implemented Memory Pages']['value']
+
+        if 'Diagnostic Pages Implemented' in transceiver_info_dict['memory_pages']:
+            diag_raw = self.__get_eeprom_cache_page(0xa00, 32)
+            if diag_raw is None:
+                return sfp_data
+            from .sonic_sfp.mis2 import mis2Diag
+            sfpd_obj = mis2Diag(diag_raw)
+            if sfpd_obj is None:
+                return sfp_data
+            diag_data = sfpd_obj.get_data_pretty()
+            if diag_data is None:
+                return sfp_data
+            transceiver_info_dict['diag_caps_loopback'] = diag_data['data']['Loopback Capabilities']
+            transceiver_info_dict['diag_caps_pattern'] = diag_data['data']['General Pattern Capabilities']
+            transceiver_info_dict['diag_caps_pattern_gen_host'] = diag_data['data']['Pattern Generator Capabilities - Host']
+            transceiver_info_dict['diag_caps_pattern_gen_media'] = diag_data['data']['Pattern Generator Capabilities - Media']
+            transceiver_info_dict['diag_caps_pattern_chk_host'] = diag_data['data']['Pattern Checker Capabilities - Host']
+            transceiver_info_dict['diag_caps_pattern_chk_media'] = diag_data['data']['Pattern Checker Capabilities - Media']
+
+        return sfp_data
+
+    # get_transceiver_info handlers and the keys they copy, per EEPROM type
+    __INFO_HANDLERS = {
+        XCVR_EEPROM_TYPE_QSFPDD: (__get_cmis_info, cmis_info_keys),
+        XCVR_EEPROM_TYPE_QSFP56: (__get_cmis_info, cmis_info_keys),
+        XCVR_EEPROM_TYPE_QSFP:   (__get_sff8636_info, qsfp_info_keys),
+        XCVR_EEPROM_TYPE_SFP:    (__get_sff8472_info, sfp_info_keys),
+        XCVR_EEPROM_TYPE_SFPDD:  (__get_mis_info, mis_info_keys),
+    }
+
     def get_transceiver_info(self):
         """
         Retrieves transceiver info of this SFP
@@ -672,246 +1480,61 @@ class SfpStandard(SfpBase):
         #To avoid redudant EEPROM reads, maintaining a per port EEPROM cache
         self.populate_eeprom_cache()
 
-        eeprom_ifraw = self.eeprom_cache
-
-        if eeprom_ifraw is None:
+        if self.eeprom_cache is None:
             syslog.syslog(syslog.LOG_ERR, "Get Transceiver Failed while reading EEPROM " \
                           "Cache for Port : {}".format(self.port_index))
             return None
 
-        type = self.get_eeprom_type(eeprom_ifraw)
+        type = self.get_eeprom_type(self.eeprom_cache)
         if type == XCVR_EEPROM_TYPE_UNKNOWN:
             return None
 
-        sfpi_obj = None
-        sfp_data = None
-        sfp_keys = {}
-        if type in (XCVR_EEPROM_TYPE_QSFPDD, XCVR_EEPROM_TYPE_QSFP56):
-            sfpi_obj = inf8628InterfaceId(eeprom_ifraw)
-            if sfpi_obj is None:
-                return None
-            sfp_data = sfpi_obj.get_data_pretty()
-
-            sfp_keys['type']             = 'Identifier'
-            sfp_keys['type_abbrv_name']  = 'type_abbrv_name'
-            sfp_keys['manufacturer']     = 'Vendor Name'
-            sfp_keys['model']            = 'Vendor Part Number'
-            sfp_keys['hardware_rev']     = 'Vendor Revision'
-            sfp_keys['serial']           = 'Vendor Serial Number'
-            sfp_keys['vendor_date']      = 'Vendor Date Code(YYYY-MM-DD Lot)'
-            sfp_keys['vendor_oui']       = 'Vendor OUI'
-            sfp_keys['module_state']     = 'Module State'
-            sfp_keys['media_type']       = 'Media Type'
-            sfp_keys['memory_type']      = 'Upper Memory Type'
-            sfp_keys['power_class']      = 'Power Class'
-            sfp_keys['revision_compliance'] = 'Revision Compliance'
-
-            for key in cmis_cable_length_types:
-                if key in sfp_data['data']:
-                    if sfp_data['data'][key] <= 0:
-                        continue
-                    transceiver_info_dict['cable_type'] = key
-                    transceiver_info_dict['cable_length'] = str(sfp_data['data'][key])
-                    break
-
-            app_adv_dict = sfp_data['data'].get('Application Advertisement')
-            if (app_adv_dict is not None) and len(app_adv_dict) > 0:
-                transceiver_info_dict['application_advertisement'] = str(app_adv_dict)
-
-            # Set the Max Speed based on the Media Type from EEPROM
-            if type == XCVR_EEPROM_TYPE_QSFP56:
-                # QSFP56 modules use 4 HW lanes and support 200G
-                transceiver_info_dict['xcvr_speed_max'] = '200000'
-            else:
-                # As of today, all the known QSFPDD modules support 400G
-                transceiver_info_dict['xcvr_speed_max'] = '400000'
-
-            # It's expected that PAGE1 could be unavailable
-            mem_page_raw = self.get_eeprom_raw(CMIS_IMPL_MEM_PAGES_ADDR, 1)
-            if mem_page_raw is None:
-                mem_page_raw = ['00']
-
-            mem_page_data = sfpi_obj.parse_implemented_memory_pages(mem_page_raw, 0)
-            if mem_page_data is not None:
-                transceiver_info_dict['memory_pages'] = mem_page_data['data']['Implemented Memory Pages']['value']
-
-            if 'Diagnostic Pages Implemented' in transceiver_info_dict['memory_pages']:
-                diag_raw = self.get_eeprom_raw(0xa00, 32)
-                if diag_raw is None:
-                    return transceiver_info_dict
-                sfpd_obj = inf8628Diag(diag_raw)
-                if sfpd_obj is None:
-                    return transceiver_info_dict
-                diag_data = sfpd_obj.get_data_pretty()
-                if diag_data is None:
-                    return transceiver_info_dict
-                transceiver_info_dict['diag_caps_loopback'] = diag_data['data']['Loopback Capabilities']
-                transceiver_info_dict['diag_caps_pattern'] = diag_data['data']['General Pattern Capabilities']
-                transceiver_info_dict['diag_caps_pattern_gen_host'] = diag_data['data']['Pattern Generator Capabilities - Host']
-                transceiver_info_dict['diag_caps_pattern_gen_media'] = diag_data['data']['Pattern Generator Capabilities - Media']
-                transceiver_info_dict['diag_caps_pattern_chk_host'] = diag_data['data']['Pattern Checker Capabilities - Host']
-                transceiver_info_dict['diag_caps_pattern_chk_media'] = diag_data['data']['Pattern Checker Capabilities - Media']
-                transceiver_info_dict['diag_caps_report'] = diag_data['data']['Reporting Capabilities']
-
-        elif type == XCVR_EEPROM_TYPE_QSFP:
-            sfpi_obj = sff8436InterfaceId(eeprom_ifraw)
-            if sfpi_obj is None:
-                return None
-            sfp_data = sfpi_obj.get_data_pretty()
-            link_code = sfpi_obj.parse_link_code(eeprom_ifraw, 192)
-            if link_code in [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x17, 0x18, \
-                            0x1A, 0x1B, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27]:
-                wavelength_data = sfpi_obj.parse_wavelength(eeprom_ifraw, 186)
-                transceiver_info_dict['wavelength'] = wavelength_data['data']['Wavelength']['value']
-
-            sfp_keys['type']             = 'Identifier'
-            sfp_keys['type_abbrv_name']  = 'type_abbrv_name'
-            sfp_keys['ext_identifier']   = 'Extended Identifier'
-            sfp_keys['encoding']         = 'Encoding'
-            sfp_keys['ext_rateselect_compliance'] = 'Extended RateSelect Compliance'
-            sfp_keys['connector']        = 'Connector'
-            sfp_keys['hardware_rev']     = 'Vendor Rev'
-            sfp_keys['manufacturer']     = 'Vendor Name'
-            sfp_keys['model']            = 'Vendor PN'
-            sfp_keys['memory_type']      = 'Upper Memory Type'
-            sfp_keys['nominal_bit_rate'] = 'Nominal Bit Rate(100Mbs)'
-            sfp_keys['serial']           = 'Vendor SN'
-            sfp_keys['vendor_date']      = 'Vendor Date Code(YYYY-MM-DD Lot)'
-            sfp_keys['vendor_oui']       = 'Vendor OUI'
-
-            for key in qsfp_cable_length_types:
-                if key in sfp_data['data']:
-                    if sfp_data['data'][key] <= 0:
-                        continue
-                    transceiver_info_dict['cable_type'] = key
-                    transceiver_info_dict['cable_length'] = str(sfp_data['data'][key])
-                    break
-
-            compliance_code_dict = sfp_data['data'].get('Specification compliance')
-            if (compliance_code_dict is not None) and len(compliance_code_dict) > 0:
-                transceiver_info_dict['specification_compliance'] = str(compliance_code_dict)
-
-            if '100G' in compliance_code_dict['10/40G Ethernet Compliance Code']:
-                transceiver_info_dict['xcvr_speed_max'] = '100000'
-            else:
-                transceiver_info_dict['xcvr_speed_max'] = '40000'
-
-        elif type == XCVR_EEPROM_TYPE_SFP:
-            sfpi_obj = sff8472InterfaceId(eeprom_ifraw)
-            if sfpi_obj is None:
-                return None
-            sfp_data = sfpi_obj.get_data_pretty()
-
-            sfp_keys['type']             = 'TypeOfTransceiver'
-            sfp_keys['type_abbrv_name']  = 'type_abbrv_name'
-            sfp_keys['manufacturer']     = 'VendorName'
-            sfp_keys['model']            = 'VendorPN'
-            sfp_keys['hardware_rev']     = 'VendorRev'
-            sfp_keys['serial']           = 'VendorSN'
-            sfp_keys['connector']        = 'Connector'
-            sfp_keys['encoding']         = 'EncodingCodes'
-            sfp_keys['ext_identifier']   = 'ExtIdentOfTypeOfTransceiver'
-            sfp_keys['nominal_bit_rate'] = 'NominalSignallingRate(UnitsOf100Mbd)'
-            sfp_keys['vendor_date']      = 'VendorDataCode(YYYY-MM-DD Lot)'
-            sfp_keys['vendor_oui']       = 'VendorOUI'
-            sfp_keys['option_values']    = 'OptionValues'
-
-            for key in sfp_cable_length_types:
-                if key in sfp_data['data']:
-                    if sfp_data['data'][key] <= 0:
-                        continue
-                    transceiver_info_dict['cable_type'] = key
-                    transceiver_info_dict['cable_length'] = str(sfp_data['data'][key])
-                    break
-
-            compliance_code_dict = sfp_data['data'].get('TransceiverCodes')
-            if (compliance_code_dict is not None) and len(compliance_code_dict) > 0:
-                transceiver_info_dict['specification_compliance'] = str(compliance_code_dict)
 
-            nbr_s = sfp_data['data']['NominalSignallingRate(UnitsOf100Mbd)']
-            if nbr_s == 'N/A':
-                transceiver_info_dict['xcvr_speed_max'] = '25000'
-            try:
-                nbr = int(nbr_s)
-            except:
-                nbr = 250
-            if nbr >= 250:
-                transceiver_info_dict['xcvr_speed_max'] = '25000'
-            elif nbr >= 100:
-                transceiver_info_dict['xcvr_speed_max'] = '10000'
-            else:
-                transceiver_info_dict['xcvr_speed_max'] = '1000'
-
-        elif type == XCVR_EEPROM_TYPE_SFPDD:
-            sfpi_obj = mis2InterfaceId(eeprom_ifraw)
-            if sfpi_obj is None:
-                return None
-            sfp_data = sfpi_obj.get_data_pretty()
-
-            sfp_keys['type']             = 'Identifier'
-            sfp_keys['type_abbrv_name']  = 'type_abbrv_name'
-            sfp_keys['manufacturer']     = 'Vendor Name'
-            sfp_keys['model']            = 'Vendor Part Number'
-            sfp_keys['hardware_rev']     = 'Vendor Revision'
-            sfp_keys['serial']           = 'Vendor Serial Number'
-            sfp_keys['vendor_date']      = 'Vendor Date Code(YYYY-MM-DD Lot)'
-            sfp_keys['vendor_oui']       = 'Vendor OUI'
-            sfp_keys['module_state']     = 'Module State'
-            sfp_keys['media_type']       = 'Media Type'
-            sfp_keys['memory_type']      = 'Upper Memory Type'
-            sfp_keys['power_class']      = 'Power Class'
-            sfp_keys['revision_compliance'] = 'Revision Compliance'
-
-            for key in mis_cable_length_types:
-                if key in sfp_data['data']:
-                    if sfp_data['data'][key] <= 0:
-                        continue
-                    transceiver_info_dict['cable_type'] = key
-                    transceiver_info_dict['cable_length'] = str(sfp_data['data'][key])
-                    break
-
-            app_adv_dict = sfp_data['data'].get('Application Advertisement')
-            if (app_adv_dict is not None) and len(app_adv_dict) > 0:
-                transceiver_info_dict['application_advertisement'] = str(app_adv_dict)
+        handler, sfp_keys = self.__INFO_HANDLERS[type]
+        sfp_data = handler(self, type, self.eeprom_cache, transceiver_info_dict)
+        if sfp_data is None:
+            return None
 
-            # As of today, all the known SFPDD modules support 100G
-            transceiver_info_dict['xcvr_speed_max'] = '100000'
-
-            # It's expected that PAGE1 could be unavailable
-            mem_page_raw = self.get_eeprom_raw(MIS2_IMPL_MEM_PAGES_ADDR, 1)
-            if mem_page_raw is None:
-                mem_page_raw = ['00']
-
-            mem_page_data = sfpi_obj.parse_implemented_memory_pages(mem_page_raw, 0)
-            if mem_page_data is not None:
-                transceiver_info_dict['memory_pages'] = mem_page_data['data']['Implemented Memory Pages']['value']
-
-            if 'Diagnostic Pages Implemented' in transceiver_info_dict['memory_pages']:
-                diag_raw = self.get_eeprom_raw(0xa00, 32)
-                if diag_raw is None:
-                    return transceiver_info_dict
-                sfpd_obj = mis2Diag(diag_raw)
-                if sfpd_obj is None:
-                    return transceiver_info_dict
-                diag_data = sfpd_obj.get_data_pretty()
-                if diag_data is None:
-                    return transceiver_info_dict
-                transceiver_info_dict['diag_caps_loopback'] = diag_data['data']['Loopback Capabilities']
-                transceiver_info_dict['diag_caps_pattern'] = diag_data['data']['General Pattern Capabilities']
-                transceiver_info_dict['diag_caps_pattern_gen_host'] = diag_data['data']['Pattern Generator Capabilities - Host']
-                transceiver_info_dict['diag_caps_pattern_gen_media'] = diag_data['data']['Pattern Generator Capabilities - Media']
-                transceiver_info_dict['diag_caps_pattern_chk_host'] = diag_data['data']['Pattern Checker Capabilities - Host']
-                transceiver_info_dict['diag_caps_pattern_chk_media'] = diag_data['data']['Pattern Checker Capabilities - Media']
-        for k in sfp_keys:
-            dict = sfp_data['data']
-            name = sfp_keys[k]
-            if name in dict:
-                transceiver_info_dict[k] = str(dict[name])
-            else:
-                transceiver_info_dict[k] = 'N/A'
+        data = sfp_data['data']
+        for k, name in sfp_keys.items():
+            val = data.get(name)
+            transceiver_info_dict[k] = 'N/A' if val is None else str(val)
 
         return transceiver_info_dict
 
+    def __check_cmis_dom_data(self, lower_raw, page11_raw, data):
+        """
+        Compare the raw CMIS DOM decoding with the inf8628Dom parser output
+        """
+        dom_raw = bytearray(CMIS_PAGE_ADDR_11h + CMIS_PAGE_SIZE)
+        dom_raw[0:len(lower_raw)] = lower_raw
+        dom_raw[CMIS_PAGE_ADDR_11h:(CMIS_PAGE_ADDR_11h + len(page11_raw))] = page11_raw
+
+        from .sonic_sfp.inf8628 import inf8628Dom
+        dom_data = inf8628Dom(_hex_list(dom_raw)).get_data_pretty()
+        if dom_data is None:
+            return
+        for name, value in data.items():
+            if dom_data['data'].get(name) != value:
+                syslog.syslog(syslog.LOG_WARNING, "Port {}: CMIS DOM {} decoded as {}, " \
+                              "inf8628Dom reports {}".format(self.port_index, name, value,
+                                                             dom_data['data'].get(name)))
+
+    def __check_cmis_thres_data(self, page02_raw, module_offset, channel_offset, data):
+        """
+        Compare the raw CMIS threshold decoding with the inf8628Dom parser output
+        """
+        from .sonic_sfp.inf8628 import inf8628Dom
+        sfpd_obj = inf8628Dom()
+        dom_raw = _hex_list(page02_raw)
+        parsed = dict(sfpd_obj.parse_module_threshold_values(dom_raw, module_offset)['data'])
+        parsed.update(sfpd_obj.parse_channel_threshold_values(dom_raw, channel_offset)['data'])
+        for name, value in data.items():
+            if parsed[name]['value'] != value:
+                syslog.syslog(syslog.LOG_WARNING, "Port {}: CMIS threshold {} decoded as {}, " \
+                              "inf8628Dom reports {}".format(self.port_index, name, value,
+                                                             parsed[name]['value']))
+
     def get_transceiver_bulk_status(self):
         """
         Retrieves transceiver bulk status of this SFP
@@ -938,8 +1561,6 @@ class SfpStandard(SfpBase):
                                    |               |for example, tx2power stands for tx power of channel 2.
         ========================================================================
         """
-        transceiver_dom_info_dict = {}
-
         dom_info_dict_keys = ['temperature', 'voltage',  'rx1power',
                               'rx2power',    'rx3power', 'rx4power',
                               'tx1bias',     'tx2bias',  'tx3bias',
@@ -948,142 +1569,135 @@ class SfpStandard(SfpBase):
                              ]
         transceiver_dom_info_dict = {}.fromkeys(dom_info_dict_keys, 'N/A')
 
-        eeprom_ifraw = self.get_eeprom_raw()
+        # Passive copper cables have no DOM to report
+        if self.__is_passive_copper():
+            return transceiver_dom_info_dict
+
+        eeprom_raw = self.read_eeprom(0, 256)
 
-        if eeprom_ifraw is None:
+        if eeprom_raw is None:
             return transceiver_dom_info_dict
 
-        type = self.get_eeprom_type(eeprom_ifraw)
+        type = self.get_eeprom_type(eeprom_raw)
 
         if type == XCVR_EEPROM_TYPE_UNKNOWN:
             return transceiver_dom_info_dict
 
         elif type in (XCVR_EEPROM_TYPE_QSFPDD, XCVR_EEPROM_TYPE_QSFP56):
-            dom_raw = [ '00' for i in range(CMIS_PAGE_ADDR_11h + CMIS_PAGE_SIZE) ]
-            dom_pos = 0
-            for x in eeprom_ifraw:
-                dom_raw[dom_pos] = x
-                dom_pos += 1
-            dom_pos = CMIS_PAGE_ADDR_11h
             # Refresh the Lane-specific Clear-on-Read registers (e.g. LOS, LOL...)
-            tmp = self.get_eeprom_raw(dom_pos + (137 & 0x7f), 16)
-            tmp = self.get_eeprom_raw(dom_pos, CMIS_PAGE_SIZE)
-            if tmp is not None:
-                for x in tmp:
-                    dom_raw[dom_pos] = x
-                    dom_pos += 1
-
-            sfpd_obj = inf8628Dom(dom_raw)
-            if sfpd_obj is None:
-                return transceiver_dom_info_dict
-            dom_data = sfpd_obj.get_data_pretty()
-            if dom_data is None:
-                return transceiver_dom_info_dict
+            tmp = self.read_eeprom(CMIS_PAGE_ADDR_11h + (137 & 0x7f), 16)
+            page11_raw = self.read_eeprom(CMIS_PAGE_ADDR_11h, CMIS_PAGE_SIZE)
+            if page11_raw is None:
+                page11_raw = bytes(CMIS_PAGE_SIZE)
 
-            transceiver_dom_info_dict['temperature'] = dom_data['data']['Temperature']
-            transceiver_dom_info_dict['voltage'] = dom_data['data']['Vcc']
-            transceiver_dom_info_dict['rx1power'] = dom_data['data']['RX1Power']
-            transceiver_dom_info_dict['rx2power'] = dom_data['data']['RX2Power']
-            transceiver_dom_info_dict['rx3power'] = dom_data['data']['RX3Power']
-            transceiver_dom_info_dict['rx4power'] = dom_data['data']['RX4Power']
-            transceiver_dom_info_dict['rx5power'] = dom_data['data']['RX5Power']
-            transceiver_dom_info_dict['rx6power'] = dom_data['data']['RX6Power']
-            transceiver_dom_info_dict['rx7power'] = dom_data['data']['RX7Power']
-            transceiver_dom_info_dict['rx8power'] = dom_data['data']['RX8Power']
-            transceiver_dom_info_dict['tx1bias'] = dom_data['data']['TX1Bias']
-            transceiver_dom_info_dict['tx2bias'] = dom_data['data']['TX2Bias']
-            transceiver_dom_info_dict['tx3bias'] = dom_data['data']['TX3Bias']
-            transceiver_dom_info_dict['tx4bias'] = dom_data['data']['TX4Bias']
-            transceiver_dom_info_dict['tx5bias'] = dom_data['data']['TX5Bias']
-            transceiver_dom_info_dict['tx6bias'] = dom_data['data']['TX6Bias']
-            transceiver_dom_info_dict['tx7bias'] = dom_data['data']['TX7Bias']
-            transceiver_dom_info_dict['tx8bias'] = dom_data['data']['TX8Bias']
-            transceiver_dom_info_dict['tx1power'] = dom_data['data']['TX1Power']
-            transceiver_dom_info_dict['tx2power'] = dom_data['data']['TX2Power']
-            transceiver_dom_info_dict['tx3power'] = dom_data['data']['TX3Power']
-            transceiver_dom_info_dict['tx4power'] = dom_data['data']['TX4Power']
-            transceiver_dom_info_dict['tx5power'] = dom_data['data']['TX5Power']
-            transceiver_dom_info_dict['tx6power'] = dom_data['data']['TX6Power']
-            transceiver_dom_info_dict['tx7power'] = dom_data['data']['TX7Power']
-            transceiver_dom_info_dict['tx8power'] = dom_data['data']['TX8Power']
+            data = _cmis_dom_data(eeprom_raw, page11_raw)
+            if self.CMIS_DOM_PARSER_CHECK:
+                self.__check_cmis_dom_data(eeprom_raw, page11_raw, data)
+            transceiver_dom_info_dict.update({dst: data[src] for dst, src in CMIS_DOM_KEYS})
 
         elif type == XCVR_EEPROM_TYPE_QSFP:
-            sfpd_obj = sff8436Dom()
-            if sfpd_obj is None:
-                return transceiver_dom_info_dict
+            sfpd_obj = self.__get_dom_parser(XCVR_EEPROM_TYPE_QSFP)
 
+            eeprom_ifraw = _hex_list(eeprom_raw)
             dom_temperature_data = sfpd_obj.parse_temperature(eeprom_ifraw, SFF8636_DOM_TEMP_ADDR)
             dom_voltage_data = sfpd_obj.parse_voltage(eeprom_ifraw, SFF8636_DOM_VOLT_ADDR)
             dom_channel_monitor_data = sfpd_obj.parse_channel_monitor_params_with_tx_power(eeprom_ifraw, SFF8636_DOM_CHAN_MON_ADDR)
-            if (int(eeprom_ifraw[SFF8636_DOM_TYPE_ADDR], 16) & 0x04) > 0:
-                transceiver_dom_info_dict['tx1power'] = dom_channel_monitor_data['data']['TX1Power']['value']
-                transceiver_dom_info_dict['tx2power'] = dom_channel_monitor_data['data']['TX2Power']['value']
-                transceiver_dom_info_dict['tx3power'] = dom_channel_monitor_data['data']['TX3Power']['value']
-                transceiver_dom_info_dict['tx4power'] = dom_channel_monitor_data['data']['TX4Power']['value']
+            data = dom_channel_monitor_data['data']
+            if eeprom_raw[SFF8636_DOM_TYPE_ADDR] & SFF8636_DOM_TYPE_TXPWR:
+                transceiver_dom_info_dict.update({dst: data[src]['value'] for dst, src in SFF8636_DOM_TXPWR_KEYS})
             transceiver_dom_info_dict['temperature'] = dom_temperature_data['data']['Temperature']['value']
             transceiver_dom_info_dict['voltage'] = dom_voltage_data['data']['Vcc']['value']
-            transceiver_dom_info_dict['rx1power'] = dom_channel_monitor_data['data']['RX1Power']['value']
-            transceiver_dom_info_dict['rx2power'] = dom_channel_monitor_data['data']['RX2Power']['value']
-            transceiver_dom_info_dict['rx3power'] = dom_channel_monitor_data['data']['RX3Power']['value']
-            transceiver_dom_info_dict['rx4power'] = dom_channel_monitor_data['data']['RX4Power']['value']
-            transceiver_dom_info_dict['tx1bias'] = dom_channel_monitor_data['data']['TX1Bias']['value']
-            transceiver_dom_info_dict['tx2bias'] = dom_channel_monitor_data['data']['TX2Bias']['value']
-            transceiver_dom_info_dict['tx3bias'] = dom_channel_monitor_data['data']['TX3Bias']['value']
-            transceiver_dom_info_dict['tx4bias'] = dom_channel_monitor_data['data']['TX4Bias']['value']
+            transceiver_dom_info_dict.update({dst: data[src]['value'] for dst, src in SFF8636_DOM_CHAN_KEYS})
 
         elif type == XCVR_EEPROM_TYPE_SFPDD:
-            # Refresh the Lane-specific Clear-on-Read registers (e.g. LOS, LOL...)
-            tmp = self.get_eeprom_raw(6, 4)
+            # Refresh the Lane-specific Clear-on-Read registers (e.g. LOS, LOL...),
+            # this must reach the module even with the read cache enabled
+            tmp = self.__read_eeprom(6, 4)
 
-            sfpd_obj = mis2Dom(eeprom_ifraw)
-            if sfpd_obj is None:
-                return transceiver_dom_info_dict
+            from .sonic_sfp.mis2 import mis2Dom
+            sfpd_obj = mis2Dom(_hex_list(eeprom_raw))
             dom_data = sfpd_obj.get_data_pretty()
             if dom_data is None:
                 return transceiver_dom_info_dict
 
-            transceiver_dom_info_dict['temperature'] = dom_data['data']['Temperature']
-            transceiver_dom_info_dict['voltage'] = dom_data['data']['Vcc']
-            transceiver_dom_info_dict['rx1power'] = dom_data['data']['RX1Power']
-            transceiver_dom_info_dict['rx2power'] = dom_data['data']['RX2Power']
-            transceiver_dom_info_dict['tx1bias'] = dom_data['data']['TX1Bias']
-            transceiver_dom_info_dict['tx2bias'] = dom_data['data']['TX2Bias']
-            transceiver_dom_info_dict['tx1power'] = dom_data['data']['TX1Power']
-            transceiver_dom_info_dict['tx2power'] = dom_data['data']['TX2Power']
+            data = dom_data['data']
+            transceiver_dom_info_dict.update({dst: data[src] for dst, src in MIS_DOM_KEYS})
 
         else:
-            dom_raw = [ '00' for i in range(128) ]
+            dom_raw = bytearray(128)
 
-            dom_temp_raw = self.get_eeprom_raw(SFF8472_DOM_TEMP_ADDR, 16)
+            dom_temp_raw = self.read_eeprom(SFF8472_DOM_TEMP_ADDR, 16)
             if dom_temp_raw is None:
                 return transceiver_dom_info_dict
-            for i in range(len(dom_temp_raw)):
-                dom_raw[(SFF8472_DOM_TEMP_ADDR & 0xff) + i] = dom_temp_raw[i]
+            dom_pos = SFF8472_DOM_TEMP_ADDR & 0xff
+            dom_raw[dom_pos:(dom_pos + len(dom_temp_raw))] = dom_temp_raw
 
-            dom_stcr_raw = self.get_eeprom_raw(SFF8472_DOM_STCR_ADDR, 1)
+            dom_stcr_raw = self.read_eeprom(SFF8472_DOM_STCR_ADDR, 1)
             if dom_stcr_raw is None:
                 return transceiver_dom_info_dict
-            for i in range(len(dom_stcr_raw)):
-                dom_raw[(SFF8472_DOM_STCR_ADDR & 0xff) + i] = dom_stcr_raw[i]
+            dom_pos = SFF8472_DOM_STCR_ADDR & 0xff
+            dom_raw[dom_pos:(dom_pos + len(dom_stcr_raw))] = dom_stcr_raw
 
-            sfpd_obj = sff8472Dom(eeprom_raw_data=dom_raw, calibration_type=1)
-            if sfpd_obj is None:
-                return transceiver_dom_info_dict
+            from .sonic_sfp.sff8472 import sff8472Dom
+            sfpd_obj = sff8472Dom(eeprom_raw_data=_hex_list(dom_raw), calibration_type=1)
             dom_data = sfpd_obj.get_data_pretty()
-            transceiver_dom_info_dict['temperature'] = dom_data['data']['MonitorData']['Temperature']
-            transceiver_dom_info_dict['voltage']     = dom_data['data']['MonitorData']['Vcc']
-            transceiver_dom_info_dict['rx1power']    = dom_data['data']['MonitorData']['RXPower']
-            transceiver_dom_info_dict['tx1power']    = dom_data['data']['MonitorData']['TXPower']
-            transceiver_dom_info_dict['tx1bias']     = dom_data['data']['MonitorData']['TXBias']
-            transceiver_dom_info_dict['rx1los']      = dom_data['data']['StatusControl']['RXLOSState']
-            transceiver_dom_info_dict['rx1los']      = 'true' if transceiver_dom_info_dict['rx1los'] == 'On' else 'false'
-            transceiver_dom_info_dict['tx1disable']  = dom_data['data']['StatusControl']['TXDisableState']
-            transceiver_dom_info_dict['tx1disable']  = 'true' if transceiver_dom_info_dict['tx1disable'] == 'On' else 'false'
-            transceiver_dom_info_dict['tx1fault']    = dom_data['data']['StatusControl']['TXFaultState']
-            transceiver_dom_info_dict['tx1fault']    = 'true' if transceiver_dom_info_dict['tx1fault'] == 'On' else 'false'
+            monitor = dom_data['data']['MonitorData']
+            status = dom_data['data']['StatusControl']
+            transceiver_dom_info_dict['temperature'] = monitor['Temperature']
+            transceiver_dom_info_dict['voltage']     = monitor['Vcc']
+            transceiver_dom_info_dict['rx1power']    = monitor['RXPower']
+            transceiver_dom_info_dict['tx1power']    = monitor['TXPower']
+            transceiver_dom_info_dict['tx1bias']     = monitor['TXBias']
+            transceiver_dom_info_dict['rx1los']      = SFF8472_DOM_STATE_STR.get(status['RXLOSState'], 'false')
+            transceiver_dom_info_dict['tx1disable']  = SFF8472_DOM_STATE_STR.get(status['TXDisableState'], 'false')
+            transceiver_dom_info_dict['tx1fault']    = SFF8472_DOM_STATE_STR.get(status['TXFaultState'], 'false')
 
         return transceiver_dom_info_dict
 
+    def __read_diag_results(self, selector, num_bytes):
+        """
+        Select the page 14h diagnostic data and wait for the module to refresh it
+
+        The results are taken once two consecutive reads agree and differ from
+        what was there before the selector was written, otherwise they are read
+        when DIAG_RESULT_TIMEOUT expires.
+        """
+        prev = self.read_eeprom(0xac0, num_bytes)
+        self.write_eeprom(0xa80, 1, [selector])
+
+        deadline = time.monotonic() + DIAG_RESULT_TIMEOUT
+        poll_interval = DIAG_RESULT_POLL_MIN
+        last = None
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll_interval, remaining))
+            poll_interval = min(poll_interval * 2, DIAG_RESULT_POLL_MAX)
+            buf = self.read_eeprom(0xac0, num_bytes)
+            if (buf is not None) and (buf != prev) and (buf == last):
+                return buf
+            last = buf
+
+        return self.read_eeprom(0xac0, num_bytes)
+
+    def __parse_mis_diag_results(self, parse, diag_raw, offsets, kind, diag_info):
+        """
+        Parse the BER or SNR results of the two SFP-DD lanes, host side then media side
+
+        Returns:
+            False if the parser failed on either side
+        """
+        diag_raw = _hex_list(diag_raw)
+        for offset, side in zip(offsets, ('host', 'media')):
+            diag_data = parse(diag_raw, offset)
+            if diag_data is None:
+                return False
+            for lane in (1, 2):
+                diag_info['diag_{}_{}{}'.format(side, kind, lane)] = \
+                    diag_data['data']['{}{}'.format(kind.upper(), lane)]['value']
+        return True
+
     def get_transceiver_diag_status(self):
         transceiver_diag_info_dict = {}
 
@@ -1091,142 +1705,111 @@ class SfpStandard(SfpBase):
             return transceiver_diag_info_dict
 
         module_type = self.get_module_type_raw()
-        if module_type not in SFF8024_TYPE_QSFPDD + \
-            SFF8024_TYPE_QSFP_CMIS_COMPLIANT:
+        if module_type not in SFF8024_TYPE_CMIS_SET:
             return transceiver_diag_info_dict
 
         if self.__is_direct_attach_cable():
             return transceiver_diag_info_dict
 
+        is_qsfpdd = (self.port_type == self.PORT_TYPE_QSFPDD)
+
         # CMIS/MIS Module State (0x03 at lower page)
-        if self.port_type == self.PORT_TYPE_QSFPDD:
-            sfpi_obj = inf8628InterfaceId()
-        elif self.port_type == self.PORT_TYPE_SFPDD:
-            sfpi_obj = mis2InterfaceId()
+        if is_qsfpdd:
+            from .sonic_sfp.inf8628 import inf8628InterfaceId as iface_class
+            rev_reg, rev_min = SfpStandard.CMIS_REG_REV, 0x30
+        else:
+            from .sonic_sfp.mis2 import mis2InterfaceId as iface_class
+            rev_reg, rev_min = SfpStandard.MIS_REG_REV, 0x20
+        sfpi_obj = iface_class()
         if sfpi_obj is None:
             return None
-        diag_raw = self.get_eeprom_raw(0x03, 1)
-        if diag_raw is None:
+        # Revision (0x01), Module State (0x03) and Power Control (0x1a) in one read
+        lower_raw = self.read_eeprom(0, MOD_POWER_ADDR + 1)
+        if lower_raw is None:
             return transceiver_diag_info_dict
-        diag_data = sfpi_obj.parse_module_state(diag_raw, 0)
+        diag_data = sfpi_obj.parse_module_state(_hex_list(lower_raw[MOD_FLAGS_ADDR:MOD_FLAGS_ADDR + 1]), 0)
         if diag_data is None:
             return transceiver_diag_info_dict
         transceiver_diag_info_dict['module_state'] = diag_data['data']['Module State']['value']
 
-        # CMIS/MIS DIAG (13h, 14h)
-        if self.port_type == self.PORT_TYPE_QSFPDD:
-            sfpd_obj = inf8628Diag()
-        elif self.port_type == self.PORT_TYPE_SFPDD:
-            sfpd_obj = mis2Diag()
-        if sfpd_obj is None:
-            return transceiver_diag_info_dict
+        if (lower_raw[rev_reg] >= rev_min):
+            sta = (lower_raw[MOD_FLAGS_ADDR] >> 1) & MOD_STATE_MASK
+            if ((sta != MOD_STATE_READY) or (lower_raw[MOD_POWER_ADDR] != 0)):
+                return transceiver_diag_info_dict
 
-        caps = self.read_eeprom(0xa02, 1)
-        if caps is None:
+        # Diagnostic capabilities (130) and PRBS controls (144 to 168) of page 13h
+        # in one read
+        prbs_cr = [144 & 0x7f, 152 & 0x7f, 160 & 0x7f, 168 & 0x7f]
+        page13_raw = self.read_eeprom(0xa00, prbs_cr[-1] + 1)
+        if page13_raw is None:
             return transceiver_diag_info_dict
-
-        if self.port_type == self.PORT_TYPE_QSFPDD:
-            rev = self.read_eeprom(SfpStandard.CMIS_REG_REV, 1)
-            revision = 0x30
-        elif self.port_type == self.PORT_TYPE_SFPDD:
-            rev = self.read_eeprom(SfpStandard.MIS_REG_REV, 1)
-            revision = 0x20
-        if (rev[0] >= revision):
-            buf = self.read_eeprom(MOD_FLAGS_ADDR, 1)
-            lwp = self.read_eeprom(MOD_POWER_ADDR, 1)
-            sta = (buf[0] >> 1) & MOD_STATE_MASK
-            if ((sta != MOD_STATE_READY) or (lwp[0] != 0)):
-                return transceiver_diag_info_dict
+        caps = page13_raw[2]
         # PRBS controls
-        prbs_cr = [144 & 0x7f, 152 & 0x7f, 160 & 0x7f, 168 & 0x7f]
         prbs_en = False
         for cr in prbs_cr:
-            buf = self.read_eeprom(0xa00 + cr, 1)
-            if (buf is not None and len(buf) > 0 and buf[0] > 0):
+            if page13_raw[cr] > 0:
                 prbs_en = True
                 break
         if not prbs_en:
             return transceiver_diag_info_dict
+
+        # CMIS/MIS DIAG (13h, 14h)
+        if not is_qsfpdd:
+            from .sonic_sfp.mis2 import mis2Diag
+            sfpd_obj = mis2Diag()
+            if sfpd_obj is None:
+                return transceiver_diag_info_dict
         # BER
-        if (caps[0] & 0x01) > 0:
-            self.write_eeprom(0xa80, 1, [0x01])
-            time.sleep(1)
-            diag_raw = self.get_eeprom_raw(0xac0, 32)
+        if (caps & 0x01) > 0:
+            diag_raw = self.__read_diag_results(0x01, 32)
             if diag_raw is None:
                 return transceiver_diag_info_dict
-            diag_data = sfpd_obj.parse_ber(diag_raw, 0)
-            if diag_data is None:
-                return transceiver_diag_info_dict
-            if self.port_type == self.PORT_TYPE_QSFPDD:
-                transceiver_diag_info_dict['diag_host_ber1'] = diag_data['data']['BER1']['value']
-                transceiver_diag_info_dict['diag_host_ber2'] = diag_data['data']['BER2']['value']
-                transceiver_diag_info_dict['diag_host_ber3'] = diag_data['data']['BER3']['value']
-                transceiver_diag_info_dict['diag_host_ber4'] = diag_data['data']['BER4']['value']
-                transceiver_diag_info_dict['diag_host_ber5'] = diag_data['data']['BER5']['value']
-                transceiver_diag_info_dict['diag_host_ber6'] = diag_data['data']['BER6']['value']
-                transceiver_diag_info_dict['diag_host_ber7'] = diag_data['data']['BER7']['value']
-                transceiver_diag_info_dict['diag_host_ber8'] = diag_data['data']['BER8']['value']
-            elif self.port_type == self.PORT_TYPE_SFPDD:
-                transceiver_diag_info_dict['diag_host_ber1'] = diag_data['data']['BER1']['value']
-                transceiver_diag_info_dict['diag_host_ber2'] = diag_data['data']['BER2']['value'] 
-
-            diag_data = sfpd_obj.parse_ber(diag_raw, 16)
-            if diag_data is None:
+            if is_qsfpdd:
+                # Host lanes then media lanes, decoded as inf8628Diag does
+                ber = [_cmis_ber_str(val) for val in struct.unpack_from('>16H', diag_raw, 0)]
+                transceiver_diag_info_dict.update(zip(CMIS_DIAG_BER_KEYS, ber))
+            elif not self.__parse_mis_diag_results(sfpd_obj.parse_ber, diag_raw, (0, 16), 'ber',
+                                                   transceiver_diag_info_dict):
                 return transceiver_diag_info_dict
-            if self.port_type == self.PORT_TYPE_QSFPDD:
-                transceiver_diag_info_dict['diag_media_ber1'] = diag_data['data']['BER1']['value']
-                transceiver_diag_info_dict['diag_media_ber2'] = diag_data['data']['BER2']['value']
-                transceiver_diag_info_dict['diag_media_ber3'] = diag_data['data']['BER3']['value']
-                transceiver_diag_info_dict['diag_media_ber4'] = diag_data['data']['BER4']['value']
-                transceiver_diag_info_dict['diag_media_ber5'] = diag_data['data']['BER5']['value']
-                transceiver_diag_info_dict['diag_media_ber6'] = diag_data['data']['BER6']['value']
-                transceiver_diag_info_dict['diag_media_ber7'] = diag_data['data']['BER7']['value']
-                transceiver_diag_info_dict['diag_media_ber8'] = diag_data['data']['BER8']['value']
-            elif self.port_type == self.PORT_TYPE_SFPDD:
-                transceiver_diag_info_dict['diag_media_ber1'] = diag_data['data']['BER1']['value']
-                transceiver_diag_info_dict['diag_media_ber2'] = diag_data['data']['BER2']['value']
         # SNR
-        if (caps[0] & 0x30) > 0:
-            self.write_eeprom(0xa80, 1, [0x06])
-            time.sleep(1)
-            diag_raw = self.get_eeprom_raw(0xac0, 64)
+        if (caps & 0x30) > 0:
+            diag_raw = self.__read_diag_results(0x06, 64)
             if diag_raw is None:
                 return transceiver_diag_info_dict
-
-            diag_data = sfpd_obj.parse_snr(diag_raw, 16)
-            if diag_data is None:
-                return transceiver_diag_info_dict
-            if self.port_type == self.PORT_TYPE_QSFPDD:
-                transceiver_diag_info_dict['diag_host_snr1'] = diag_data['data']['SNR1']['value']
-                transceiver_diag_info_dict['diag_host_snr2'] = diag_data['data']['SNR2']['value']
-                transceiver_diag_info_dict['diag_host_snr3'] = diag_data['data']['SNR3']['value']
-                transceiver_diag_info_dict['diag_host_snr4'] = diag_data['data']['SNR4']['value']
-                transceiver_diag_info_dict['diag_host_snr5'] = diag_data['data']['SNR5']['value']
-                transceiver_diag_info_dict['diag_host_snr6'] = diag_data['data']['SNR6']['value']
-                transceiver_diag_info_dict['diag_host_snr7'] = diag_data['data']['SNR7']['value']
-                transceiver_diag_info_dict['diag_host_snr8'] = diag_data['data']['SNR8']['value']
-            elif self.port_type == self.PORT_TYPE_SFPDD:
-                transceiver_diag_info_dict['diag_host_snr1'] = diag_data['data']['SNR1']['value']
-                transceiver_diag_info_dict['diag_host_snr2'] = diag_data['data']['SNR2']['value']
-
-            diag_data = sfpd_obj.parse_snr(diag_raw, 48)
-            if diag_data is None:
+            if is_qsfpdd:
+                # Host lanes then media lanes, decoded as inf8628Diag does
+                snr = struct.unpack_from('<8H', diag_raw, 16) + struct.unpack_from('<8H', diag_raw, 48)
+                transceiver_diag_info_dict.update(zip(CMIS_DIAG_SNR_KEYS, [_cmis_snr_str(val) for val in snr]))
+            elif not self.__parse_mis_diag_results(sfpd_obj.parse_snr, diag_raw, (16, 48), 'snr',
+                                                   transceiver_diag_info_dict):
                 return transceiver_diag_info_dict
-            if self.port_type == self.PORT_TYPE_QSFPDD:
-                transceiver_diag_info_dict['diag_media_snr1'] = diag_data['data']['SNR1']['value']
-                transceiver_diag_info_dict['diag_media_snr2'] = diag_data['data']['SNR2']['value']
-                transceiver_diag_info_dict['diag_media_snr3'] = diag_data['data']['SNR3']['value']
-                transceiver_diag_info_dict['diag_media_snr4'] = diag_data['data']['SNR4']['value']
-                transceiver_diag_info_dict['diag_media_snr5'] = diag_data['data']['SNR5']['value']
-                transceiver_diag_info_dict['diag_media_snr6'] = diag_data['data']['SNR6']['value']
-                transceiver_diag_info_dict['diag_media_snr7'] = diag_data['data']['SNR7']['value']
-                transceiver_diag_info_dict['diag_media_snr8'] = diag_data['data']['SNR8']['value']
-            elif self.port_type == self.PORT_TYPE_SFPDD:
-                transceiver_diag_info_dict['diag_media_snr1'] = diag_data['data']['SNR1']['value']
-                transceiver_diag_info_dict['diag_media_snr2'] = diag_data['data']['SNR2']['value']
 
         return transceiver_diag_info_dict
 
+    # DOM parsers holding no EEPROM data, shared by all the ports
+    __DOM_PARSERS = {}
+
+    def __get_dom_parser(self, type):
+        """
+        Get the shared DOM parser of the EEPROM type, one of the non-CMIS types
+        of DOM_THRES_SPECS. The raw data is passed to each of its parse calls.
+        """
+        sfpd_obj = self.__DOM_PARSERS.get(type)
+        if sfpd_obj is not None:
+            return sfpd_obj
+
+        if type == XCVR_EEPROM_TYPE_QSFP:
+            from .sonic_sfp.sff8436 import sff8436Dom
+            sfpd_obj = sff8436Dom()
+        elif type == XCVR_EEPROM_TYPE_SFP:
+            from .sonic_sfp.sff8472 import sff8472Dom
+            sfpd_obj = sff8472Dom(calibration_type=1)
+        else:
+            from .sonic_sfp.mis2 import mis2Dom
+            sfpd_obj = mis2Dom()
+        self.__DOM_PARSERS[type] = sfpd_obj
+        return sfpd_obj
+
     def get_transceiver_threshold_info(self):
         """
         Retrieves transceiver threshold info of this SFP
@@ -1258,160 +1841,56 @@ class SfpStandard(SfpBase):
         txbiaslowwarning           |FLOAT          |Low Warning Threshold value of tx Bias Current in mA.
         ========================================================================
         """
-        transceiver_dom_threshold_info_dict = {}
-
-        dom_info_dict_keys = ['temphighalarm',    'temphighwarning',
-                              'templowalarm',     'templowwarning',
-                              'vcchighalarm',     'vcchighwarning',
-                              'vcclowalarm',      'vcclowwarning',
-                              'rxpowerhighalarm', 'rxpowerhighwarning',
-                              'rxpowerlowalarm',  'rxpowerlowwarning',
-                              'txpowerhighalarm', 'txpowerhighwarning',
-                              'txpowerlowalarm',  'txpowerlowwarning',
-                              'txbiashighalarm',  'txbiashighwarning',
-                              'txbiaslowalarm',   'txbiaslowwarning'
-                             ]
-        transceiver_dom_threshold_info_dict = {}.fromkeys(dom_info_dict_keys, 'N/A')
-
-        eeprom_ifraw = self.get_eeprom_raw()
-        if eeprom_ifraw is None:
-            return transceiver_dom_threshold_info_dict
-
-        type = self.get_eeprom_type(eeprom_ifraw)
-
-        if type == XCVR_EEPROM_TYPE_UNKNOWN:
-            return transceiver_dom_threshold_info_dict
-
-        elif type in (XCVR_EEPROM_TYPE_QSFPDD, XCVR_EEPROM_TYPE_QSFP56):
-            dom_raw = self.get_eeprom_raw(CMIS_DOM_THRES_ADDR, 128)
-            if dom_raw is None:
-                return transceiver_dom_threshold_info_dict
-
-            sfpd_obj = inf8628Dom()
-            if sfpd_obj is None:
-                return transceiver_dom_threshold_info_dict
-
-            dom_module_threshold_data  = sfpd_obj.parse_module_threshold_values(dom_raw, CMIS_DOM_THRES_MODULE_OFFSET)
-            dom_channel_threshold_data = sfpd_obj.parse_channel_threshold_values(dom_raw, CMIS_DOM_THRES_CHANNEL_OFFSET)
-            transceiver_dom_threshold_info_dict['temphighalarm']   = dom_module_threshold_data['data']['TempHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['temphighwarning'] = dom_module_threshold_data['data']['TempHighWarning']['value']
-            transceiver_dom_threshold_info_dict['templowalarm']    = dom_module_threshold_data['data']['TempLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['templowwarning']  = dom_module_threshold_data['data']['TempLowWarning']['value']
-            transceiver_dom_threshold_info_dict['vcchighalarm']    = dom_module_threshold_data['data']['VccHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['vcchighwarning']  = dom_module_threshold_data['data']['VccHighWarning']['value']
-            transceiver_dom_threshold_info_dict['vcclowalarm']     = dom_module_threshold_data['data']['VccLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['vcclowwarning']   = dom_module_threshold_data['data']['VccLowWarning']['value']
-            transceiver_dom_threshold_info_dict['rxpowerhighalarm']   = dom_channel_threshold_data['data']['RxPowerHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['rxpowerhighwarning'] = dom_channel_threshold_data['data']['RxPowerHighWarning']['value']
-            transceiver_dom_threshold_info_dict['rxpowerlowalarm']    = dom_channel_threshold_data['data']['RxPowerLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['rxpowerlowwarning']  = dom_channel_threshold_data['data']['RxPowerLowWarning']['value']
-            transceiver_dom_threshold_info_dict['txpowerhighalarm']   = dom_channel_threshold_data['data']['TxPowerHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['txpowerhighwarning'] = dom_channel_threshold_data['data']['TxPowerHighWarning']['value']
-            transceiver_dom_threshold_info_dict['txpowerlowalarm']    = dom_channel_threshold_data['data']['TxPowerLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['txpowerlowwarning']  = dom_channel_threshold_data['data']['TxPowerLowWarning']['value']
-            transceiver_dom_threshold_info_dict['txbiashighalarm']    = dom_channel_threshold_data['data']['TxBiasHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['txbiashighwarning']  = dom_channel_threshold_data['data']['TxBiasHighWarning']['value']
-            transceiver_dom_threshold_info_dict['txbiaslowalarm']     = dom_channel_threshold_data['data']['TxBiasLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['txbiaslowwarning']   = dom_channel_threshold_data['data']['TxBiasLowWarning']['value']
-
-        elif type == XCVR_EEPROM_TYPE_QSFP:
-            dom_raw = self.get_eeprom_raw(SFF8636_DOM_THRES_ADDR, 128)
-            if dom_raw is None:
-                return transceiver_dom_threshold_info_dict
-
-            sfpd_obj = sff8436Dom()
-            if sfpd_obj is None:
-                return transceiver_dom_threshold_info_dict
-
-            dom_module_threshold_data = sfpd_obj.parse_module_threshold_values(dom_raw, SFF8636_DOM_THRES_MODULE_OFFSET)
-            dom_channel_threshold_data = sfpd_obj.parse_channel_threshold_values(dom_raw, SFF8636_DOM_THRES_CHANNEL_OFFSET)
-            transceiver_dom_threshold_info_dict['temphighalarm']   = dom_module_threshold_data['data']['TempHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['temphighwarning'] = dom_module_threshold_data['data']['TempHighWarning']['value']
-            transceiver_dom_threshold_info_dict['templowalarm']    = dom_module_threshold_data['data']['TempLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['templowwarning']  = dom_module_threshold_data['data']['TempLowWarning']['value']
-            transceiver_dom_threshold_info_dict['vcchighalarm']    = dom_module_threshold_data['data']['VccHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['vcchighwarning']  = dom_module_threshold_data['data']['VccHighWarning']['value']
-            transceiver_dom_threshold_info_dict['vcclowalarm']     = dom_module_threshold_data['data']['VccLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['vcclowwarning']   = dom_module_threshold_data['data']['VccLowWarning']['value']
-            transceiver_dom_threshold_info_dict['rxpowerhighalarm']   = dom_channel_threshold_data['data']['RxPowerHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['rxpowerhighwarning'] = dom_channel_threshold_data['data']['RxPowerHighWarning']['value']
-            transceiver_dom_threshold_info_dict['rxpowerlowalarm']    = dom_channel_threshold_data['data']['RxPowerLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['rxpowerlowwarning']  = dom_channel_threshold_data['data']['RxPowerLowWarning']['value']
-            if (int(eeprom_ifraw[SFF8636_DOM_TYPE_ADDR], 16) & 0x04) > 0:
-                transceiver_dom_threshold_info_dict['txpowerhighalarm']   = dom_channel_threshold_data['data']['TxPowerHighAlarm']['value']
-                transceiver_dom_threshold_info_dict['txpowerhighwarning'] = dom_channel_threshold_data['data']['TxPowerHighWarning']['value']
-                transceiver_dom_threshold_info_dict['txpowerlowalarm']    = dom_channel_threshold_data['data']['TxPowerLowAlarm']['value']
-                transceiver_dom_threshold_info_dict['txpowerlowwarning']  = dom_channel_threshold_data['data']['TxPowerLowWarning']['value']
-            transceiver_dom_threshold_info_dict['txbiashighalarm']    = dom_channel_threshold_data['data']['TxBiasHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['txbiashighwarning']  = dom_channel_threshold_data['data']['TxBiasHighWarning']['value']
-            transceiver_dom_threshold_info_dict['txbiaslowalarm']     = dom_channel_threshold_data['data']['TxBiasLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['txbiaslowwarning']   = dom_channel_threshold_data['data']['TxBiasLowWarning']['value']
-
-        elif type == XCVR_EEPROM_TYPE_SFP:
-            dom_raw = self.get_eeprom_raw(SFF8472_DOM_THRES_ADDR, 40)
-            if dom_raw is None:
-                return transceiver_dom_threshold_info_dict
-            sfpd_obj = sff8472Dom(calibration_type=1)
-            if sfpd_obj is None:
-                return transceiver_dom_threshold_info_dict
-
-            dom_threshold_data = sfpd_obj.parse_alarm_warning_threshold(dom_raw, 0)
-            transceiver_dom_threshold_info_dict['temphighalarm']      = dom_threshold_data['data']['TempHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['temphighwarning']    = dom_threshold_data['data']['TempHighWarning']['value']
-            transceiver_dom_threshold_info_dict['templowalarm']       = dom_threshold_data['data']['TempLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['templowwarning']     = dom_threshold_data['data']['TempLowWarning']['value']
-            transceiver_dom_threshold_info_dict['vcchighalarm']       = dom_threshold_data['data']['VoltageHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['vcchighwarning']     = dom_threshold_data['data']['VoltageHighWarning']['value']
-            transceiver_dom_threshold_info_dict['vcclowalarm']        = dom_threshold_data['data']['VoltageLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['vcclowwarning']      = dom_threshold_data['data']['VoltageLowWarning']['value']
-            transceiver_dom_threshold_info_dict['rxpowerhighalarm']   = dom_threshold_data['data']['RXPowerHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['rxpowerhighwarning'] = dom_threshold_data['data']['RXPowerHighWarning']['value']
-            transceiver_dom_threshold_info_dict['rxpowerlowalarm']    = dom_threshold_data['data']['RXPowerLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['rxpowerlowwarning']  = dom_threshold_data['data']['RXPowerLowWarning']['value']
-            transceiver_dom_threshold_info_dict['txbiashighalarm']    = dom_threshold_data['data']['BiasHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['txbiashighwarning']  = dom_threshold_data['data']['BiasHighWarning']['value']
-            transceiver_dom_threshold_info_dict['txbiaslowalarm']     = dom_threshold_data['data']['BiasLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['txbiaslowwarning']   = dom_threshold_data['data']['BiasLowWarning']['value']
-            transceiver_dom_threshold_info_dict['txpowerhighalarm']   = dom_threshold_data['data']['TXPowerHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['txpowerhighwarning'] = dom_threshold_data['data']['TXPowerHighWarning']['value']
-            transceiver_dom_threshold_info_dict['txpowerlowalarm']    = dom_threshold_data['data']['TXPowerLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['txpowerlowwarning']  = dom_threshold_data['data']['TXPowerLowWarning']['value']
-
-        elif type == XCVR_EEPROM_TYPE_SFPDD:
-            dom_raw = self.get_eeprom_raw(MIS2_DOM_THRES_ADDR, 128)
-            if dom_raw is None:
-                return transceiver_dom_threshold_info_dict
+        # The thresholds are static, classify the module from the EEPROM cache
+        self.populate_eeprom_cache()
+        eeprom_raw = self.eeprom_cache
+        if eeprom_raw is None:
+            return dict(DOM_THRES_NA)
+
+        type = self.get_eeprom_type(eeprom_raw)
+        spec = DOM_THRES_SPECS.get(type)
+        if spec is None:
+            return dict(DOM_THRES_NA)
+        addr, num_bytes, module_offset, channel_offset, module_keys, channel_keys = spec
+
+        dom_raw = self.__get_eeprom_cache_bytes(addr, num_bytes)
+        if dom_raw is None:
+            return dict(DOM_THRES_NA)
+
+        # Every key is decoded, except the QSFP TX power thresholds, so the
+        # dict is built in one go and only falls back to the N/A defaults
+        # when some keys are left out
+        if type in (XCVR_EEPROM_TYPE_QSFPDD, XCVR_EEPROM_TYPE_QSFP56):
+            data = _cmis_thres_data(dom_raw, module_offset, channel_offset)
+            if self.CMIS_DOM_PARSER_CHECK:
+                self.__check_cmis_thres_data(dom_raw, module_offset, channel_offset, data)
+            return {dst: data[src] for dst, src in module_keys + channel_keys}
 
-            sfpd_obj = mis2Dom()
-            if sfpd_obj is None:
-                return transceiver_dom_threshold_info_dict
-
-            dom_module_threshold_data  = sfpd_obj.parse_module_threshold_values(dom_raw, MIS2_DOM_THRES_MODULE_OFFSET)
-            dom_channel_threshold_data = sfpd_obj.parse_channel_threshold_values(dom_raw, MIS2_DOM_THRES_CHANNEL_OFFSET)
-            transceiver_dom_threshold_info_dict['temphighalarm']   = dom_module_threshold_data['data']['TempHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['temphighwarning'] = dom_module_threshold_data['data']['TempHighWarning']['value']
-            transceiver_dom_threshold_info_dict['templowalarm']    = dom_module_threshold_data['data']['TempLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['templowwarning']  = dom_module_threshold_data['data']['TempLowWarning']['value']
-            transceiver_dom_threshold_info_dict['vcchighalarm']    = dom_module_threshold_data['data']['VccHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['vcchighwarning']  = dom_module_threshold_data['data']['VccHighWarning']['value']
-            transceiver_dom_threshold_info_dict['vcclowalarm']     = dom_module_threshold_data['data']['VccLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['vcclowwarning']   = dom_module_threshold_data['data']['VccLowWarning']['value']
-            transceiver_dom_threshold_info_dict['rxpowerhighalarm']   = dom_channel_threshold_data['data']['RxPowerHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['rxpowerhighwarning'] = dom_channel_threshold_data['data']['RxPowerHighWarning']['value']
-            transceiver_dom_threshold_info_dict['rxpowerlowalarm']    = dom_channel_threshold_data['data']['RxPowerLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['rxpowerlowwarning']  = dom_channel_threshold_data['data']['RxPowerLowWarning']['value']
-            transceiver_dom_threshold_info_dict['txpowerhighalarm']   = dom_channel_threshold_data['data']['TxPowerHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['txpowerhighwarning'] = dom_channel_threshold_data['data']['TxPowerHighWarning']['value']
-            transceiver_dom_threshold_info_dict['txpowerlowalarm']    = dom_channel_threshold_data['data']['TxPowerLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['txpowerlowwarning']  = dom_channel_threshold_data['data']['TxPowerLowWarning']['value']
-            transceiver_dom_threshold_info_dict['txbiashighalarm']    = dom_channel_threshold_data['data']['TxBiasHighAlarm']['value']
-            transceiver_dom_threshold_info_dict['txbiashighwarning']  = dom_channel_threshold_data['data']['TxBiasHighWarning']['value']
-            transceiver_dom_threshold_info_dict['txbiaslowalarm']     = dom_channel_threshold_data['data']['TxBiasLowAlarm']['value']
-            transceiver_dom_threshold_info_dict['txbiaslowwarning']   = dom_channel_threshold_data['data']['TxBiasLowWarning']['value']
+        sfpd_obj = self.__get_dom_parser(type)
+        dom_raw = _hex_list(dom_raw)
 
+        if type == XCVR_EEPROM_TYPE_SFP:
+            dom_module_threshold_data = sfpd_obj.parse_alarm_warning_threshold(dom_raw, module_offset)
+            dom_channel_threshold_data = dom_module_threshold_data
         else:
-            pass
+            dom_module_threshold_data = sfpd_obj.parse_module_threshold_values(dom_raw, module_offset)
+            dom_channel_threshold_data = sfpd_obj.parse_channel_threshold_values(dom_raw, channel_offset)
+
+        module_data = dom_module_threshold_data['data']
+        channel_data = dom_channel_threshold_data['data']
+
+        # TX power thresholds only with TX power monitoring
+        if (type == XCVR_EEPROM_TYPE_QSFP) and ((eeprom_raw[SFF8636_DOM_TYPE_ADDR] & SFF8636_DOM_TYPE_TXPWR) == 0):
+            transceiver_dom_threshold_info_dict = dict(DOM_THRES_NA)
+            transceiver_dom_threshold_info_dict.update(
+                {dst: module_data[src]['value'] for dst, src in module_keys})
+            transceiver_dom_threshold_info_dict.update(
+                {dst: channel_data[src]['value'] for dst, src in DOM_THRES_CHANNEL_NO_TXPWR_KEYS})
+            return transceiver_dom_threshold_info_dict
 
+        transceiver_dom_threshold_info_dict = {dst: module_data[src]['value'] for dst, src in module_keys}
+        transceiver_dom_threshold_info_dict.update(
+            {dst: channel_data[src]['value'] for dst, src in channel_keys})
         return transceiver_dom_threshold_info_dict
 
     def soft_reset(self):
@@ -1425,26 +1904,28 @@ class SfpStandard(SfpBase):
             return False
 
         self.eeprom_lock.acquire()
-
-        # Identifier
-        id = self.__read_eeprom(SfpStandard.CMIS_REG_ID, 1)
-        if (id is None) or (id[0] not in SfpStandard.CMIS_IDS):
-            self.eeprom_lock.release()
-            return False
-
-        # Revision Compliance ID
-        rev = self.__read_eeprom(SfpStandard.CMIS_REG_REV, 1)
-        if (rev is None) or (rev[0] < 0x30):
+        try:
+            # Identifier
+            id = self.__read_eeprom(SfpStandard.CMIS_REG_ID, 1)
+            if (id is None) or (id[0] not in SfpStandard.CMIS_IDS):
+                return False
+
+            # Revision Compliance ID
+            rev = self.__read_eeprom(SfpStandard.CMIS_REG_REV, 1)
+            if (rev is None) or (rev[0] < 0x30):
+                return False
+
+            off = SfpStandard.CMIS_REG_MOD_CTRL
+            val = SfpStandard.CMIS_MOD_CTRL_SW_RESET | SfpStandard.CMIS_MOD_CTRL_FORCE_LP
+            ret = self.__write_eeprom(off, 1, [val])
+        finally:
             self.eeprom_lock.release()
-            return False
 
-        off = SfpStandard.CMIS_REG_MOD_CTRL
-        val = SfpStandard.CMIS_MOD_CTRL_SW_RESET | SfpStandard.CMIS_MOD_CTRL_FORCE_LP
-        ret = self.__write_eeprom(off, 1, [val])
+        # Wait for the reset to complete outside of the lock, so that other
+        # threads accessing this port are not held up for the whole second.
+        # Their reads may fail until the module is back.
         if ret:
             time.sleep(1)
-
-        self.eeprom_lock.release()
         return ret
 
     def __cable_diagnostics_vct(self):
@@ -1460,10 +1941,13 @@ class SfpStandard(SfpBase):
         length                     |STRING         |The cable length in meters
         ========================================================================
         """
+        # Back-to-back requests get the result of the test just completed
+        last = self._vct_last
+        if (last is not None) and ((time.monotonic() - last[0]) < VCT_RESULT_HOLD):
+            return dict(last[1])
+
         copper_base = 0x8180
-        length_map = ['< 50m',  '50 - 80m', '80 - 110m', '110 - 140m',
-                      '> 140m', '> 140m',   '> 140m',    '> 140m']
-        status_map = ['OK', 'SHORT', 'OPEN', 'FAILED']
+        status_map = VCT_STATUS_MAP
         status = len(status_map) - 1
         res = { 'result': 'FAILED' }
         for retries in range(3):
@@ -1471,17 +1955,15 @@ class SfpStandard(SfpBase):
             buf = [0x80]
             if not self.write_eeprom(copper_base + 28 * 2, len(buf), buf):
                 return res
-            for t in range(20):
-                time.sleep(0.5)
-                buf = self.read_eeprom(copper_base + 28 * 2, 1)
-                if buf is None:
-                    return res
-                if (buf[0] & 0x80) == 0:
-                    break
+            buf = self.__wait_ready(copper_base + 28 * 2, 0x80)
+            if buf is None:
+                return res
             status = len(status_map) - 1
             # Timeout
             if buf[0] & 0x80:
                 continue
+            # The per-pair results all live in register 28, banked behind
+            # the page register 22, so each pair needs its own select/read
             for chan in range(4):
                 buf = [chan]
                 if not self.write_eeprom(copper_base + 22 * 2, len(buf), buf):
@@ -1510,36 +1992,41 @@ class SfpStandard(SfpBase):
             if val is None:
                 res['result'] = 'FAILED'
             else:
-                res['length'] = length_map[(val >> 7) & 0x07]
+                res['length'] = VCT_LENGTH_MAP[(val >> 7) & 0x07]
+        if res['result'] != 'FAILED':
+            self._vct_last = (time.monotonic(), dict(res))
         return res
 
-    def __twos_comp(self, num, bits):
-        try:
-            if ((num & (1 << (bits - 1))) != 0):
-                num = num - (1 << bits)
-            return num
-        except:
-            return 0
+    def __wait_ready(self, offset, mask):
+        """
+        Poll an EEPROM byte until the bits selected by mask are all clear, or
+        DIAG_READY_TIMEOUT expires
 
-    def __get_byte(self, off):
-        byte = 0
-        try:
-            buf = self.read_eeprom(off, 1)
-            if buf is not None:
-                byte = buf[0]
-        except:
-            byte = 0
-        return byte
+        Returns:
+            bytearray, the last value read, or None if a read failed
+        """
+        deadline = time.monotonic() + DIAG_READY_TIMEOUT
+        delay = DIAG_READY_POLL_MIN
+        while True:
+            buf = self.read_eeprom(offset, 1)
+            if (buf is None) or ((buf[0] & mask) == 0):
+                return buf
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return buf
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, DIAG_READY_POLL_MAX)
+
+    def __read_dom_block(self, offset, num_bytes):
+        """
+        Read a DOM block in a single transaction, the bytes of a failed read
+        are taken as zero
+        """
+        buf = self.read_eeprom(offset, num_bytes)
+        if buf is None:
+            buf = bytearray(num_bytes)
+        return buf
 
-    def __get_word(self, off):
-        word = 0
-        try:
-            buf = self.read_eeprom(off, 2)
-            if buf is not None:
-                word = (buf[0] << 8) | buf[1]
-        except:
-            word = 0
-        return word
 
     def __cable_diagnostics_sff8472(self):
         """
@@ -1562,13 +2049,9 @@ class SfpStandard(SfpBase):
             return res
 
         # Data Ready (BIT0), low active
-        for t in range(100):
-            buf = self.read_eeprom(SFF8472_DOM_STCR_ADDR, 1)
-            if buf is None:
-                return res
-            if (buf[0] & SFF8472_DOM_STCR_NOT_READY) == 0:
-                break
-            time.sleep(0.1)
+        buf = self.__wait_ready(SFF8472_DOM_STCR_ADDR, SFF8472_DOM_STCR_NOT_READY)
+        if buf is None:
+            return res
 
         # Decode the DOM information and perform sanity checks
         eopt = cap[0]
@@ -1577,58 +2060,22 @@ class SfpStandard(SfpBase):
             res['result'] = 'Timeout'
             return res
 
-        # Temp.
-        val = self.__twos_comp(self.__get_word(SFF8472_DOM_TEMP_ADDR), 16)
-        top = self.__twos_comp(self.__get_word(SFF8472_DOM_TEMP_WARM_HI_ADDR), 16)
-        low = self.__twos_comp(self.__get_word(SFF8472_DOM_TEMP_WARM_LO_ADDR), 16)
-        if top > 1:
-            if low >= val:
-                res['result'] = 'Lo TEMP'
-                return res
-            if top <= val:
-                res['result'] = 'Hi TEMP'
-                return res
-        else:
-            res['result'] = 'Not Supported'
-            return res
+        # Thresholds and monitors are both in A2h, read them at once
+        dom = self.__read_dom_block(SFF8472_DOM_ADDR, SFF8472_DIAG_BLOCK_SIZE)
 
-        # Volt.
-        val = self.__get_word(SFF8472_DOM_VOLT_ADDR)
-        top = self.__get_word(SFF8472_DOM_VOLT_WARM_HI_ADDR)
-        low = self.__get_word(SFF8472_DOM_VOLT_WARM_LO_ADDR)
-        if top > 1:
-            if low >= val:
-                res['result'] = 'Lo VOLT'
-                return res
-            if top <= val:
-                res['result'] = 'Hi VOLT'
-                return res
-        else:
-            res['result'] = 'Not Supported'
-            return res
-
-        # Rx Power
-        val = self.__get_word(SFF8472_DOM_RXPWR_ADDR)
-        top = self.__get_word(SFF8472_DOM_RXPWR_WARM_HI_ADDR)
-        low = self.__get_word(SFF8472_DOM_RXPWR_WARM_LO_ADDR)
-        if top > 1:
-            if low >= val:
-                res['result'] = 'Lo RxPwr'
-                return res
-            if top <= val:
-                res['result'] = 'Hi RxPwr'
-                return res
-
-        # Tx Power
-        val = self.__get_word(SFF8472_DOM_TXPWR_ADDR)
-        top = self.__get_word(SFF8472_DOM_TXPWR_WARM_HI_ADDR)
-        low = self.__get_word(SFF8472_DOM_TXPWR_WARM_LO_ADDR)
-        if top > 1:
-            if low >= val:
-                res['result'] = 'Lo TxPwr'
-                return res
-            if top <= val:
-                res['result'] = 'Hi TxPwr'
+        for unpack, val_off, top_off, low_off, lo_result, hi_result, required in SFF8472_DIAG_CHECKS:
+            val = unpack(dom, val_off)[0]
+            top = unpack(dom, top_off)[0]
+            low = unpack(dom, low_off)[0]
+            if top > 1:
+                if low >= val:
+                    res['result'] = lo_result
+                    return res
+                if top <= val:
+                    res['result'] = hi_result
+                    return res
+            elif required:
+                res['result'] = 'Not Supported'
                 return res
 
         # RX_LOS
@@ -1669,80 +2116,84 @@ class SfpStandard(SfpBase):
         res = {}
 
         # Data Ready (BIT0), low active
-        for t in range(100):
-            buf = self.read_eeprom(SFF8636_MOD_STATE_ADDR, 1)
-            if buf is None:
-                return res
-            if (buf[0] & SFF8636_MOD_STATE_NOT_READY) == 0:
-                break
-            time.sleep(0.1)
+        buf = self.__wait_ready(SFF8636_MOD_STATE_ADDR, SFF8636_MOD_STATE_NOT_READY)
+        if buf is None:
+            return res
         if buf[0] & SFF8636_MOD_STATE_NOT_READY:
             res['result'] = 'Timeout'
             return res
 
-        # Temp.
-        val = self.__twos_comp(self.__get_word(SFF8636_DOM_TEMP_ADDR), 16)
-        top = self.__twos_comp(self.__get_word(SFF8636_DOM_TEMP_WARM_HI_ADDR), 16)
-        low = self.__twos_comp(self.__get_word(SFF8636_DOM_TEMP_WARM_LO_ADDR), 16)
-        if top > 1:
-            if top <= val:
-                res['result'] = 'Hi TEMP'
-                return res
-            if low >= val:
-                res['result'] = 'Lo TEMP'
-                return res
-        else:
-            res['result'] = 'Not Supported'
-            return res
+        # Monitors are in the lower page, thresholds in page 03h
+        mon = self.__read_dom_block(0, 256)
+        thres = self.__read_dom_block(SFF8636_DOM_THRES_ADDR, 128)
 
-        # Volt.
-        val = self.__get_word(SFF8636_DOM_VOLT_ADDR)
-        top = self.__get_word(SFF8636_DOM_VOLT_WARM_HI_ADDR)
-        low = self.__get_word(SFF8636_DOM_VOLT_WARM_LO_ADDR)
-        if top > 1:
+        for unpack, val_addr, top_off, low_off, lo_result, hi_result in SFF8636_DIAG_CHECKS:
+            val = unpack(mon, val_addr)[0]
+            top = unpack(thres, top_off)[0]
+            low = unpack(thres, low_off)[0]
+            if top <= 1:
+                res['result'] = 'Not Supported'
+                return res
             if top <= val:
-                res['result'] = 'Hi VOLT'
+                res['result'] = hi_result
                 return res
             if low >= val:
-                res['result'] = 'Lo VOLT'
+                res['result'] = lo_result
                 return res
-        else:
-            res['result'] = 'Not Supported'
-            return res
 
-        # Rx Power
-        top = self.__get_word(SFF8636_DOM_RXPWR_WARM_HI_ADDR)
-        low = self.__get_word(SFF8636_DOM_RXPWR_WARM_LO_ADDR)
-        if top > 1:
-            for lane in range(0, 4):
-                val = self.__get_word(SFF8636_DOM_RXPWR_ADDR + (2 * lane))
-                if top <= val:
-                    res['result'] = 'Hi RxPwr(L{0})'.format(lane + 1)
-                    return res
-                if low >= val:
-                    res['result'] = 'Lo RxPwr(L{0})'.format(lane + 1)
-                    return res
-
-        # Tx Power
-        if self.__get_byte(SFF8636_DOM_TYPE_ADDR) & 0x04:
-            top = self.__get_word(SFF8636_DOM_TXPWR_WARM_HI_ADDR)
-            low = self.__get_word(SFF8636_DOM_TXPWR_WARM_LO_ADDR)
+        # Tx Power only with TX power monitoring
+        if mon[SFF8636_DOM_TYPE_ADDR] & SFF8636_DOM_TYPE_TXPWR:
+            lane_checks = SFF8636_DIAG_LANE_CHECKS
         else:
-            top = 0
-            low = 0
-        if top > 1:
-            for lane in range(0, 4):
-                val = self.__get_word(SFF8636_DOM_TXPWR_ADDR + (2 * lane))
+            lane_checks = SFF8636_DIAG_LANE_CHECKS[:1]
+        for val_addr, top_off, low_off, lo_results, hi_results in lane_checks:
+            top = _U16(thres, top_off)[0]
+            low = _U16(thres, low_off)[0]
+            if top <= 1:
+                continue
+            for lane, val in enumerate(struct.unpack_from('>4H', mon, val_addr)):
                 if top <= val:
-                    res['result'] = 'Hi TxPwr(L{0})'.format(lane + 1)
+                    res['result'] = hi_results[lane]
                     return res
                 if low >= val:
-                    res['result'] = 'Lo TxPwr(L{0})'.format(lane + 1)
+                    res['result'] = lo_results[lane]
                     return res
 
         res['result'] = 'PASS'
         return res
 
+    def __get_sff8472_compliance_codes(self):
+        """
+        Get the decoded SFF-8472 transceiver compliance codes, from the interface
+        id data already parsed by get_transceiver_info()
+
+        Returns:
+            A frozenset of the compliance code strings, or None if not available
+        """
+        from .sonic_sfp.sff8472 import sff8472InterfaceId
+        sfpi_obj, sfp_data = self.__parse_interface_id(sff8472InterfaceId, self.eeprom_cache)
+        if sfpi_obj is None:
+            return None
+        codes = sfp_data['data'].get('TransceiverCodes')
+        if not isinstance(codes, dict):
+            return None
+        return frozenset(codes.values())
+
+    def __get_cached_transceiver_info(self):
+        """
+        Get the transceiver info of the current module, parsed at most once
+        until the EEPROM cache is cleared
+        """
+        gen = self._eeprom_generation
+        cached = self._info_cache
+        if (cached is not None) and (cached[0] == gen):
+            return cached[1]
+
+        info = self.get_transceiver_info()
+        if info is not None:
+            self._info_cache = (gen, info)
+        return info
+
     def cable_diagnostics(self):
         """
         Retrieves cable diagnostics info of this SFP
@@ -1761,13 +2212,18 @@ class SfpStandard(SfpBase):
         report_dict = {}.fromkeys(report_keys, 'N/A')
         report_dict['type'] = 'XCVR'
         report_dict['result'] = 'Not Supported'
-        info = self.get_transceiver_info()
+        info = self.__get_cached_transceiver_info()
         if info is not None:
             report_dict['vendor_name'] = info['manufacturer']
             report_dict['part_number'] = info['model']
             try:
                 if info['type_abbrv_name'] in ['SFP']:
-                    if '1000BASE-T' in info.get('specification_compliance'):
+                    codes = self.__get_sff8472_compliance_codes()
+                    if codes is None:
+                        is_copper = '1000BASE-T' in info.get('specification_compliance')
+                    else:
+                        is_copper = '1000BASE-T' in codes
+                    if is_copper:
                         report_dict['type'] = 'TDR'
                         report_dict.update(self.__cable_diagnostics_vct())
                 else:
@@ -1775,7 +2231,7 @@ class SfpStandard(SfpBase):
             except:
                 pass
 
-        report_dict['timestamp'] = datetime.now().strftime("%d-%b-%Y %H:%M:%S")
+        report_dict['timestamp'] = time.strftime("%d-%b-%Y %H:%M:%S")
         return report_dict
 
     def hard_tx_disable(self, tx_disable):
@@ -8,7 +8,7 @@
 import inspect
 import syslog
 
-from .ext_media_utils import DEFAULT_NO_DATA_VALUE, media_eeprom_address, sfp_read_bytes
+from .ext_media_utils import DEFAULT_NO_DATA_VALUE, media_eeprom_address, sfp_read_bytes, read_eeprom_byte
 from .ext_media_common import get_form_factor_info, \
         qsfp56_dd_prep_to_set_fec_mode, qsfp56_dd_set_media_fec_mode, qsfp56_dd_get_media_fec_mode, \
         qsfp28_enable_media_power, qsfp28_select_rate, is_qsfp28_dd, qsfp28_dd_select_rate, qsfp28_dd_media_lockdown_set
@@ -16,9 +16,62 @@ from .ext_media_handler_base import media_static_info
 from .ext_media_cmis_init import cmis_init
 from .ext_media_cmis_diag import cmis_diag
 
-CMIS_VER_ADDR = media_eeprom_address(offset=1)
 CMIS_VER_3= 0x30
 
+# Default maximum power, in watts, per port form-factor
+DEFAULT_PORT_POWER = {
+    'QSFP':      4.0,
+    'QSFP+':     4.0,
+    'QSFP28':    4.5,
+    'QSFP28-DD': 8.0,
+    'QSFP56':    8.0,
+    'QSFP56-DD': 10.0,
+}
+DEFAULT_PORT_POWER_OTHER = 2.5
+
+# (EEPROM generation, form-factor name) per port index, of the modules
+# classified by get_static_info(), see get_cached_form_factor()
+_form_factor_cache = {}
+
+# Qualified media part numbers, a frozenset per platform object id
+_qualified_media_cache = {}
+
+# Override dict per platform object id
+_override_dict_cache = {}
+
+# Media form-factors which plug into a QSFP port through a QSA adapter
+QSA_MEDIA_FORM_FACTORS = frozenset(['SFP', 'SFP+', 'SFP28', 'SFP56-DD'])
+
+# Errors of a handler method which can not decode its field from the EEPROM,
+# the field is then reported as DEFAULT_NO_DATA_VALUE. Any other error is
+# logged as a warning, and also reports that field only as DEFAULT_NO_DATA_VALUE.
+HANDLER_METH_ERRORS = (KeyError, IndexError, AttributeError, TypeError, ValueError, NotImplementedError)
+
+# Handler modules are named after their class, with this prefix
+HANDLER_MODULE_PREFIX = 'ext_media_handler_'
+
+# Form-factor handler class per handler module name, resolved on first use
+_handler_class_cache = {}
+
+# (method name, result key) of the functions which are expected to be
+# implemented by handler, the key is the suffix of the get_*** method
+_std_meth_keys = tuple((meth, meth.split('get_')[1]) for meth, _ in
+        inspect.getmembers(media_static_info, lambda x: inspect.ismethod(x) or inspect.isfunction(x)))
+
+# (result key, function) tables per handler class, see get_meth_table()
+_meth_table_cache = {}
+
+"""
+Resolves the standard methods on the handler class once, the function is None
+when the handler class does not implement the method
+"""
+def get_meth_table(handler_class):
+    table = _meth_table_cache.get(handler_class)
+    if table is None:
+        table = tuple((key, getattr(handler_class, meth, None)) for meth, key in _std_meth_keys)
+        _meth_table_cache[handler_class] = table
+    return table
+
 """
 Finds the appropriate driver module, executes calls
 Returns a dictionary of attributes from media, with default of DEFAULT_NO_DATA_VALUE is not able to get data.
@@ -41,19 +94,24 @@ def get_static_info(sfp_obj, platform_obj=None):
         if None is form_factor_module:
             raise NotImplementedError("Unable to find implementation for form-factor: " + str(form_factor_name))
 
+        get_generation = getattr(sfp_obj, 'get_eeprom_generation', None)
+        if get_generation is not None:
+            _form_factor_cache[sfp_obj.port_index] = (get_generation(), form_factor_name)
+
         form_factor_module_name = str(form_factor_module.__name__)
         # Based on the form-factor, select the obj
 
-        # Get the classes
-        handler_class_list = inspect.getmembers(form_factor_module, lambda cl: inspect.isclass(cl))
-
-        handler_class = None
-
         # Pick class which matches filename, less ext_media prefix
-        for cl_name, cl in handler_class_list:
-            if form_factor_module_name.split('ext_media_handler_')[1] ==  cl_name:
-                handler_class = cl
-                break
+        if form_factor_module_name in _handler_class_cache:
+            handler_class = _handler_class_cache[form_factor_module_name]
+        else:
+            handler_class = None
+            file_name = form_factor_module_name.rpartition('.')[2]
+            if file_name.startswith(HANDLER_MODULE_PREFIX):
+                handler_class = getattr(form_factor_module, file_name[len(HANDLER_MODULE_PREFIX):], None)
+            if not inspect.isclass(handler_class):
+                handler_class = None
+            _handler_class_cache[form_factor_module_name] = handler_class
         if handler_class is None:
             return None
 
@@ -66,23 +124,24 @@ def get_static_info(sfp_obj, platform_obj=None):
     except:
         pass
 
-    # List of functions which are expected to be implemented by handler 
-    std_meth_list = inspect.getmembers(media_static_info, lambda x: inspect.ismethod(x) or inspect.isfunction(x))
+    handler_class = None if handler_inst is None else type(handler_inst)
 
     ret_dict = dict()
     # Now pick and run only methods which intersect 
-    for meth, _ in std_meth_list:
-        # Key is the suffix of the get_*** method
-        key = meth.split('get_')[1]
+    for key, func in get_meth_table(handler_class):
         # Set default value
         value = DEFAULT_NO_DATA_VALUE
-        try:
-            value = str(getattr(handler_inst, meth)(eeprom_bytes))
-            if value == 'None':
-                value = DEFAULT_NO_DATA_VALUE
-        except Exception as e:
-            #print("Could not perform {} on device {}: {}".format(meth, eeprom_path, e))
-            pass
+        if func is not None:
+            try:
+                raw = func(handler_inst, eeprom_bytes)
+                if raw is not None:
+                    value = str(raw)
+            except HANDLER_METH_ERRORS as e:
+                syslog.syslog(syslog.LOG_DEBUG, "Could not get {} on device {}: {}".format(key, eeprom_path, e))
+            except Exception as e:
+                # Unexpected handler failure, only this field is lost
+                syslog.syslog(syslog.LOG_WARNING, "Failed to get {} on device {}: {}: {}".format(
+                              key, eeprom_path, type(e).__name__, e))
         ret_dict[key] = value
 
     if ret_dict['cable_class'] == 'FIBER':
@@ -93,34 +152,56 @@ def get_static_info(sfp_obj, platform_obj=None):
     except AttributeError:
         ret_dict['qsa_adapter'] = str(get_qsa_status(ret_dict, sfp_obj))
 
+    # Each of the platform fields is left out on its own on failure
     try:
         ret_dict['is_qualified'] = str(is_qualified(ret_dict, platform_obj, sfp_obj))
+    except Exception:
+        pass
 
+    try:
         ret_dict['max_port_power'] = str(get_max_port_power(sfp_obj))
+    except Exception:
+        pass
 
-        # Vendor remap based on part number
+    # Vendor remap based on part number
+    try:
         remap = get_overrides(ret_dict, platform_obj)
         for key in  remap:
             ret_dict[key] = remap[key]
-    except:
+    except Exception:
         pass
 
     return ret_dict
 
 
+"""
+Gets the form-factor name found by get_static_info(), or None if the module
+was not classified since its insertion
+"""
+def get_cached_form_factor(sfp_obj):
+    cached = _form_factor_cache.get(sfp_obj.port_index)
+    if cached is None:
+        return None
+    get_generation = getattr(sfp_obj, 'get_eeprom_generation', None)
+    if (get_generation is None) or (get_generation() != cached[0]):
+        return None
+    return cached[1]
+
 """
 Checks if the QSA adapter is connected 
 Basically if the port is Q*** and the module inserted is s***, then a QSA must have been used
 """
 def get_qsa_status(info_dict, sfp_obj):
+    get_port_form_factor = getattr(sfp_obj, 'get_port_form_factor', None)
+    if get_port_form_factor is None:
+        return DEFAULT_NO_DATA_VALUE
+    media_ff = info_dict.get('form_factor', DEFAULT_NO_DATA_VALUE)
     try:
-        media_ff = info_dict.get('form_factor', DEFAULT_NO_DATA_VALUE)
-
-        port_ff = sfp_obj.get_port_form_factor()
+        port_ff = get_port_form_factor()
         # Form factor starts with 'Q'
-        if port_ff[0] == 'Q' and media_ff in ['SFP', 'SFP+', 'SFP28', 'SFP56-DD']:
+        if port_ff and port_ff.startswith('Q') and media_ff in QSA_MEDIA_FORM_FACTORS:
             return 'Present'
-    except:
+    except Exception:
         pass
 
     return DEFAULT_NO_DATA_VALUE
@@ -129,52 +210,61 @@ def get_qsa_status(info_dict, sfp_obj):
 Gets the maximum power the port is allowed to dissipate
 """
 def get_max_port_power(sfp_obj):
-    try:
-        return sfp_obj.get_max_port_power()
-    except:
-        pass
+    get_power = getattr(sfp_obj, 'get_max_port_power', None)
+    if get_power is not None:
+        try:
+            return get_power()
+        except Exception:
+            pass
 
     # We can try to use port defaults
-    try:
-        port_ff = sfp_obj.get_port_form_factor()
-        if port_ff in ['QSFP', 'QSFP+']:
-            return 4.0
-        elif port_ff in ['QSFP28']:
-            return 4.5
-        elif port_ff in ['QSFP28-DD']:
-            return 8.0
-        elif port_ff in ['QSFP56']:
-            return 8.0
-        elif port in ['QSFP56-DD']:
-            return 10.0
-        else:
-            return 2.5
-    except:
-        pass
+    get_port_form_factor = getattr(sfp_obj, 'get_port_form_factor', None)
+    if get_port_form_factor is not None:
+        try:
+            return DEFAULT_PORT_POWER.get(get_port_form_factor(), DEFAULT_PORT_POWER_OTHER)
+        except Exception:
+            pass
     return DEFAULT_NO_DATA_VALUE
 
 """
 We check the media part info against the set of supported parts from the given platform
 """
 def is_qualified(info_dict, platform_obj, sfp_obj):
-    try:
-        if info_dict['vendor_part_number'] in platform_obj.get_qualified_media_list():
-            return True
-    except:
-        pass
+    qualified = _qualified_media_cache.get(id(platform_obj))
+    if qualified is None:
+        get_qualified_media_list = getattr(platform_obj, 'get_qualified_media_list', None)
+        if get_qualified_media_list is None:
+            return False
+        try:
+            media_list = get_qualified_media_list()
+            if media_list is None:
+                return False
+            qualified = frozenset(media_list)
+        except Exception:
+            return False
+        _qualified_media_cache[id(platform_obj)] = qualified
 
-    return False
+    return info_dict.get('vendor_part_number') in qualified
 
 """
 Contains maps to override or extend the standard fields with vendor-specific info, based on some attribures
 This provides a mechanism for media attributes to be updated by using the part number
 """
 def get_overrides(info_dict, platform_obj):
-    try:
-        return platform_obj.get_override_dict()[info_dict['vendor_part_number']]
-    except:
-        pass
-    return dict()
+    overrides = _override_dict_cache.get(id(platform_obj))
+    if overrides is None:
+        get_override_dict = getattr(platform_obj, 'get_override_dict', None)
+        if get_override_dict is None:
+            return dict()
+        try:
+            overrides = get_override_dict()
+        except Exception:
+            return dict()
+        if overrides is None:
+            return dict()
+        _override_dict_cache[id(platform_obj)] = overrides
+
+    return overrides.get(info_dict.get('vendor_part_number'), dict())
 
 def default_cmis_3_4_init(sfp_obj, application, lanes_per_port):
     """
@@ -198,15 +288,19 @@ def default_cmis_3_4_init(sfp_obj, application, lanes_per_port):
         syslog.syslog(syslog.LOG_ERR, "CMIS: ERR: {0}".format(ex))
     return False
 
+# (sfp_obj, cmis_diag) pairs, keyed by port index. At most one per port, the
+# pair is replaced when the port gets a new SFP object.
 initialized_cmis_diag_dict = {}
 
 def get_cmis_dom_info(sfp_obj):
     global initialized_cmis_diag_dict
 
     try:
-        if sfp_obj not in initialized_cmis_diag_dict.keys():
-            initialized_cmis_diag_dict[sfp_obj] = cmis_diag(sfp_obj, logging=False)
-        return initialized_cmis_diag_dict[sfp_obj].get_dom_info()
+        key = sfp_obj.port_index
+        entry = initialized_cmis_diag_dict.get(key)
+        if (entry is None) or (entry[0] is not sfp_obj):
+            entry = initialized_cmis_diag_dict[key] = (sfp_obj, cmis_diag(sfp_obj, logging=False))
+        return entry[1].get_dom_info()
     except:
         pass
     return None
@@ -215,7 +309,9 @@ def control_cmis_diags(sfp_obj, mode, enable):
     global initialized_cmis_diag_dict
 
     try:
-        return initialized_cmis_diag_dict[sfp_obj].set_cmis_loopback_mode_enable(mode, enable)
+        entry = initialized_cmis_diag_dict[sfp_obj.port_index]
+        if entry[0] is sfp_obj:
+            return entry[1].set_cmis_loopback_mode_enable(mode, enable)
     except:
         pass
     return False
@@ -234,9 +330,12 @@ def select_rate(sfp_obj, rate):
     sfp_obj: Media object
     rate : Rate to be selected
     """
-    eeprom_path = sfp_obj.get_eeprom_sysfs_path()
-    eeprom = sfp_obj.get_eeprom_cache_raw()
-    if is_qsfp28_dd(eeprom):
+    form_factor_name = get_cached_form_factor(sfp_obj)
+    if form_factor_name is not None:
+        qsfp28_dd = (form_factor_name == 'QSFP28-DD')
+    else:
+        qsfp28_dd = is_qsfp28_dd(sfp_obj.get_eeprom_cache_raw())
+    if qsfp28_dd:
         return qsfp28_dd_select_rate(sfp_obj, rate)
     else:
         return qsfp28_select_rate(sfp_obj, rate)
@@ -264,8 +363,17 @@ def get_media_fec_mode(sfp_obj):
 
 def media_lockdown_set(sfp_obj, status):
     """ media lockdown set """
-    cmis_ver = sfp_read_bytes(sfp_obj, CMIS_VER_ADDR, 1)[0]
-    sfp_id = sfp_read_bytes(sfp_obj, media_eeprom_address(offset=0), 1)[0]
+    # Identifier and CMIS revision are static, take them from the page 00h
+    # EEPROM cache, which is refreshed on module insertion
+    eeprom = sfp_obj.get_eeprom_cache_raw()
+    if eeprom is not None:
+        sfp_id = read_eeprom_byte(eeprom, media_eeprom_address(offset=0))
+        cmis_ver = read_eeprom_byte(eeprom, media_eeprom_address(offset=1))
+    else:
+        # Identifier and CMIS revision are adjacent, read them in one go
+        buf = sfp_read_bytes(sfp_obj, media_eeprom_address(offset=0), 2)
+        sfp_id = buf[0]
+        cmis_ver = buf[1]
     # if qsfp dd or qsfp +
     if (cmis_ver >= CMIS_VER_3) and (sfp_id == 0x18 or sfp_id == 0x1e):
         return qsfp28_dd_media_lockdown_set(sfp_obj, status)
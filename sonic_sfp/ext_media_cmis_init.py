@@ -6,8 +6,10 @@ from .ext_media_utils import media_eeprom_address
 SEC_TO_MS = 1000
 MIN_TO_MS = 60*SEC_TO_MS
 
-# Encoding for the datapath timeouts
-timeout_map_ms = {0:1, 1:5, 2:10, 3:50, 4:100, 5:500, 6:1*SEC_TO_MS, 7:5*SEC_TO_MS, 8: 10*SEC_TO_MS, 9: 1*MIN_TO_MS, 10: 5*MIN_TO_MS, 11: 10*MIN_TO_MS, 12: 50*MIN_TO_MS}
+# Encoding for the datapath timeouts, indexed by the 4 bit code. The reserved
+# codes 13-15 map to 10 seconds.
+timeout_map_ms = (1, 5, 10, 50, 100, 500, 1*SEC_TO_MS, 5*SEC_TO_MS, 10*SEC_TO_MS, 1*MIN_TO_MS, 5*MIN_TO_MS,
+                  10*MIN_TO_MS, 50*MIN_TO_MS, 10*SEC_TO_MS, 10*SEC_TO_MS, 10*SEC_TO_MS)
 
 # Addr, len of bytes to read
 
@@ -52,6 +54,7 @@ MOD_STATE_READY = 3
 MOD_STATE_PWR_DN = 4
 MOD_STATE_FAULT = 5
 
+DATAPATH_STATE_DEACTIVATED = 0x11111111
 DATAPATH_STATE_ACTIVATE = 0x44444444
 DATAPATH_STATE_INITIALIZED = 0x77777777
 CONFIG_STATE_ACCEPTED = 0x11111111
@@ -68,23 +71,73 @@ INIT_TYPE_COMPLETE = 0
 INIT_TYPE_AUTO = -1
 
 
+# The datapath and config state polls start with a STATE_POLL_MIN seconds
+# interval, doubled after each poll up to STATE_POLL_MAX
+STATE_POLL_MIN = 0.001
+STATE_POLL_MAX = 0.5
+
+# Module firmware init after a reset: a fixed MOD_RESET_SETTLE seconds, then
+# the module state is polled from MOD_RESET_POLL_MIN seconds on, for up to
+# MOD_RESET_TIMEOUT seconds in total
+MOD_RESET_SETTLE = 0.05
+MOD_RESET_POLL_MIN = 0.01
+MOD_RESET_TIMEOUT = 2.0
+
+# The IntL polls start with an INTL_POLL_MIN seconds interval, doubled after
+# each poll up to STATE_POLL_MAX
+INTL_POLL_MIN = 0.02
+
+# Time budget, in seconds, of the state polls
+DP_DEACTIVATE_TIMEOUT = 20
+CONFIG_ACCEPT_TIMEOUT = 5
+DP_ACTIVATE_TIMEOUT = 30
+
+# Init type per media type encoding
+MEDIA_TYPE_INIT_TYPES = {
+    0x03: INIT_TYPE_QUICK,      # Passive copper cables
+    0x05: INIT_TYPE_QUICK,      # Base-T
+    0x04: INIT_TYPE_MEDIUM,     # Active cables
+    0x01: INIT_TYPE_COMPLETE,   # MMF
+    0x02: INIT_TYPE_COMPLETE,   # SMF
+}
+
 DEFAULT_APPLICATION = 1
 class cmis_init:
-    def logger(self, s):
-        if self.logging:
-            log = "{0}: {1}: {2}".format(datetime.now(), self.sfp_obj.eeprom_path, s)
-            syslog.syslog(syslog.LOG_NOTICE, log)
+    # self.logger is bound to one of these by __init__, depending on logging
+    def _logger_on(self, s):
+        syslog.syslog(syslog.LOG_NOTICE, "%s: %s: %s" % (datetime.now(), self.sfp_obj.eeprom_path, s))
+
+    def _logger_off(self, s):
+        pass
+
+    logger = _logger_off
 
     def reset(self):
         ret = False
         try:
             ret = self.sfp_obj.reset()
-            # Firmware init needs 2 seconds delay on reset
-            time.sleep(2)
+            self._clear_static_cache()
+            # Firmware init needs up to 2 seconds delay on reset
+            time.sleep(MOD_RESET_SETTLE)
+            self._wait_mod_state((MOD_STATE_LOW_PWR, MOD_STATE_READY),
+                                 MOD_RESET_TIMEOUT - MOD_RESET_SETTLE)
         except:
             ret = False
         return ret
 
+    # Poll the module state until it is one of states, or timeout_s expires
+    def _wait_mod_state(self, states, timeout_s):
+        deadline = time.monotonic() + timeout_s
+        backoff = self._adaptive_wait(start=MOD_RESET_POLL_MIN)
+        while True:
+            buf = self.read_bytes(MOD_FLAGS_ADDR[0], 1)
+            if buf and ((buf[0] >> 1) & MOD_STATE_MASK) in states:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(next(backoff), remaining))
+
     # Dummy functions those will be override when available
     def get_lpmode(self):
         return True
@@ -97,10 +150,19 @@ class cmis_init:
 
     # Get the CMIS version. 3.0 and 4.0 have slightly different methods
     def get_cmis_ver(self):
-        self.logger("Reading CMIS version")
-        ret = self.read_bytes(*CMIS_VER_ADDR)[0]
-        self.logger("Got CMIS version value of {}".format(hex(ret)))
-        return ret
+        if self._cmis_ver_cache is None:
+            self.logger("Reading CMIS version")
+            self._cmis_ver_cache = self.read_bytes(*CMIS_VER_ADDR)[0]
+            self.logger("Got CMIS version value of {}".format(hex(self._cmis_ver_cache)))
+        return self._cmis_ver_cache
+
+    # Advertised module fields read during the init sequence, kept until the
+    # module is reset
+    def _clear_static_cache(self):
+        self._cmis_ver_cache = None
+        self._dp_timeout_cache = None
+        self._max_power_cache = None
+        self._media_type = None
 
     # Get the general faults
     def get_general_faults(self):
@@ -136,13 +198,13 @@ class cmis_init:
             val = (0xFF if state else 0x00)
         else:
             val = (0x00 if state else 0xFF)
-        self.write_bytes(DATAPATH_DE_INIT_ADDR[0], [val])
+        self.write_bytes(DATAPATH_DE_INIT_ADDR[0], bytes((val,)))
 
     # Set software based high power
     def set_high_power(self):
         val = 0x00
         self.logger("Setting media to software-based high power mode")
-        self.write_bytes(LOW_PWR_ADDR[0], [val])
+        self.write_bytes(LOW_PWR_ADDR[0], bytes((val,)))
 
     # Get module fault
     def get_mod_fault(self):
@@ -155,17 +217,82 @@ class cmis_init:
     def set_tx_disable(self, state):
         self.logger("Setting tx disable to "+str(state))
         val = (0xFF if state else 0x00)
-        self.write_bytes(TX_DISABLE_ADDR[0], [val])
+        self.write_bytes(TX_DISABLE_ADDR[0], bytes((val,)))
 
     def get_datapath_timeout(self):
+        if self._dp_timeout_cache is not None:
+            return self._dp_timeout_cache
         self.logger("Getting timeout for datapath config")
         val = self.read_bytes(*DATAPATH_INIT_TIMEOUT)[0]
 
-        val &= 0x0F
-        ret = timeout_map_ms.get(val, 10*SEC_TO_MS)
+        ret = timeout_map_ms[val & 0x0F]
         self.logger("Got datapath timeout val of {}ms ".format(str(ret)))
+        self._dp_timeout_cache = ret
         return ret
 
+    # Get the max power byte of the module
+    def get_max_power(self):
+        if self._max_power_cache is None:
+            self._max_power_cache = self.read_bytes(*CMIS_MAX_POWER_CLASS_ADDR)[0]
+        return self._max_power_cache
+
+
+    # Staged Control Set 0 application select payload of the 8 lanes
+    def _staged_payload(self, application, lanes_per_port, toggle_bit0):
+        val = (application << 4) | (0x01 if toggle_bit0 else 0x00)
+        if lanes_per_port not in (1, 2, 4, 8):
+            lanes_per_port = 8
+        # Bits 1-3: the first lane of the data path the lane belongs to
+        return bytes(val | ((lane & ~(lanes_per_port - 1)) << 1) for lane in range(8))
+
+    # Stage the application select payload, then apply it with data path init.
+    # These stay two writes: the apply byte (143) sits below the select bytes
+    # (145-152), so a single write covering both would reach the apply byte,
+    # and trigger it, before the new select bytes.
+    def _apply_staged_payload(self, payload):
+        self.write_bytes(STAGED_CS0_SELECT_ADDR[0], payload)
+        self.write_bytes(STAGED_CS0_APPLY_ADDR[0], bytes((0xff,)))
+
+    # Poll intervals, in seconds, growing exponentially from start up to cap
+    def _adaptive_wait(self, start=STATE_POLL_MIN, cap=STATE_POLL_MAX):
+        d = start
+        while True:
+            yield d
+            d = min(cap, d * 2)
+
+    # Wait for IntL to go to 0, for up to timeout_s seconds. Returns False if it
+    # is still asserted (high) at the deadline
+    def _wait_intl_clear(self, timeout_s):
+        deadline = time.monotonic() + timeout_s
+        backoff = self._adaptive_wait(start=INTL_POLL_MIN)
+        while self.get_intl_state() == True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self.logger("Waiting for INTL to be 0, timeout(s): {0:.2f}".format(remaining))
+            time.sleep(min(next(backoff), remaining))
+        return True
+
+    # Poll a 32 bit state word, the first 4 bytes returned by reader, until its
+    # bits selected by mask match one of targets or timeout_s expires.
+    # Returns the match result and the last word read (None if none was read)
+    def _wait_word(self, reader, targets, mask, timeout_s, desc):
+        targets = [target & mask for target in targets]
+        word = None
+        t = 0
+        deadline = time.monotonic() + timeout_s
+        backoff = self._adaptive_wait()
+        while time.monotonic() < deadline:
+            time.sleep(next(backoff))
+            t += 1
+            buf = reader()
+            if (buf is None) or (len(buf) < 4):
+                continue
+            word = int.from_bytes(buf[:4], 'big')
+            self.logger("{0}...{1},{2}".format(desc, t, hex(word)))
+            if (word & mask) in targets:
+                return True, word
+        return False, word
 
     # The driver (optoe) uses a flat addressing space, while the actual device is paged
     def _page_to_flat_offset(self, addr):
@@ -174,6 +301,7 @@ class cmis_init:
             return ((addr.page+1)*128) + (addr.offset & 0x7f)
         return addr.offset
 
+    # Returns the bytes read as a bytearray, None if the read failed
     def read_bytes(self, addr, length):
         offset = self._page_to_flat_offset(addr)
         ret = self.sfp_obj.read_eeprom(offset, length)
@@ -181,35 +309,20 @@ class cmis_init:
             self.logger("Read failed for addr {}".format(vars(addr)))
         return ret
 
-        self.logger("Will read {} byte(s) from addr {}".format(length, vars(addr)))
-
-        with open(self.sfp_obj.eeprom_path, 'rb+') as fp:
-            fp.seek(offset)
-            b = fp.read(length)
-            # TODO remove these python2/3 checks once completely moved to python3
-            if type(b) == bytes:
-                # python3
-                ret = [int(a) for a in b]
-            else:
-                # python2
-                ret = [int(ord(a)) for a in b]
-            self.logger("Read back "+str(ret))
-            return ret
-        self.logger("Read failed for addr {}".format(vars(addr)))
-        return []
-
-    def write_bytes(self, addr, bytes):
+    # Writes data, a bytes-like object (or a list of byte values)
+    def write_bytes(self, addr, data):
         offset = self._page_to_flat_offset(addr)
-        self.sfp_obj.write_eeprom(offset, len(bytes), bytes)
+        self.sfp_obj.write_eeprom(offset, len(data), data)
 
     def check_power_compat(self):
-        power_max_code = (self.read_bytes(*CMIS_MAX_POWER_CLASS_ADDR)[0] >> 5) & 0x07
+        power_max = self.get_max_power()
+        power_max_code = (power_max >> 5) & 0x07
         power_old_method = 0.0
         if power_max_code < 0x07:
             # Hard-coded power values
             power_old_method = [1.5, 2.0, 2.5, 3.5, 4.0, 4.5, 5.0][power_max_code]
         # Alternatively, power is encoded as unsigned int in units of 0.25W
-        pwr = max(power_old_method, float(self.read_bytes(*CMIS_MAX_POWER_CLASS_ADDR)[0]) * 0.25)
+        pwr = max(power_old_method, float(power_max) * 0.25)
 
         self.logger("Read media max power is "+str(pwr)+ " Watts")
         if pwr > self.max_port_power():
@@ -219,20 +332,18 @@ class cmis_init:
 
     def determine_init_type(self):
         # Determine best init type based on the general complexity of the module
-        m_type = self.read_bytes(*CMIS_MEDIA_TYPE_ENCODING_ADDR)[0]
+        if self._media_type is None:
+            self._media_type = self.read_bytes(*CMIS_MEDIA_TYPE_ENCODING_ADDR)[0]
+        init_type = MEDIA_TYPE_INIT_TYPES.get(self._media_type)
 
-        if m_type in [0x03, 0x05]:
+        if init_type == INIT_TYPE_QUICK:
             # Cables. Simple init
             return INIT_TYPE_QUICK
         # No quick SW init for 3.0
         if self.cmis_ver == 0x30:
             return INIT_TYPE_COMPLETE
-        if m_type in [0x04]:
-            # Active cables
-            return INIT_TYPE_MEDIUM
-        if m_type in [0x01, 0x02]:
-            # SMF, MMF
-            return INIT_TYPE_COMPLETE
+        if init_type is not None:
+            return init_type
 
         self.logger("Could not determined init type automatically. Will use quick init")
         return INIT_TYPE_QUICK
@@ -241,9 +352,11 @@ class cmis_init:
     def __init__(self, sfp_obj, logging=False):
         self.lanes_per_port = 1
         self.logging = logging
+        self.logger = self._logger_on if logging else self._logger_off
         if sfp_obj == None:
             raise ValueError("Need proper arg")
         self.sfp_obj = sfp_obj
+        self._clear_static_cache()
 
         self.logger("Init new cmis obj with object "+str(sfp_obj))
 
@@ -292,13 +405,17 @@ class cmis_init:
         except:
             self.logger("IntL state getter not found. Init may not work as needed.")
 
+        # Form factor and CMIS version are adjacent, read them in one go
+        hdr = self.read_bytes(FORM_FACTOR_VER_ADDR[0], 2)
+
         # QSFP56 follows CMIS 5.0/CMIS 4.0 specs similar to QSFP56-DD module
-        if self.read_bytes(*FORM_FACTOR_VER_ADDR)[0] not in (0x18, 0x19, 0x1e):
+        if hdr[0] not in (0x18, 0x19, 0x1e):
             self.logger("Invalid module for CMIS initialization. Exiting")
             self.cmis_ver = -1
             return
 
-        self.cmis_ver = self.get_cmis_ver()
+        self.cmis_ver = self._cmis_ver_cache = hdr[1]
+        self.logger("Got CMIS version value of {}".format(hex(self.cmis_ver)))
 
     def initialize_cmis4(self, application=DEFAULT_APPLICATION, lanes_per_port=8, retries=1):
         ready = False
@@ -326,86 +443,30 @@ class cmis_init:
             self.reset()
             val = 0x10
             self.logger("CMIS4: Setting media to force lowpower mode")
-            self.write_bytes(LOW_PWR_ADDR[0], [val])
+            self.write_bytes(LOW_PWR_ADDR[0], bytes((val,)))
             self.logger("CMIS4: Enforce Tx disable")
             self.set_tx_disable(True)
             # Deinitialize datapath
             self.set_datapath_init(False)
             time.sleep(1)
 
-            err_d = [0, 0]
-            for t in range(20):
-                time.sleep(1)
-                buf = self.get_datapath_activated_states()
-                err_d[0] = (buf[0] << 24) | (buf[1] << 16) | (buf[2] << 8) | buf[3]
-                self.logger("CMIS4: checking datapath deactive states...{0},{1}".format(t, hex(err_d[0])))
-                if err_d[0] == 0x11111111:
-                    break
-
-            # Do application selection
-            bytes = []
-            for n in range(8):
-                bytes.append(application << 4)
-
-            # Setting up the first lane of each port/datapath
-            if lanes_per_port == 8:
-                pass
-            elif lanes_per_port == 4:
-                bytes[4] |= 0x08
-                bytes[5] |= 0x08
-                bytes[6] |= 0x08
-                bytes[7] |= 0x08
-            elif lanes_per_port == 2:
-                bytes[2] |= 0x04
-                bytes[3] |= 0x04
-                bytes[4] |= 0x08
-                bytes[5] |= 0x08
-                bytes[6] |= 0x0c
-                bytes[7] |= 0x0c
-            elif lanes_per_port == 1:
-                bytes[1] |= 0x02
-                bytes[2] |= 0x04
-                bytes[3] |= 0x06
-                bytes[4] |= 0x08
-                bytes[5] |= 0x0a
-                bytes[6] |= 0x0c
-                bytes[7] |= 0x0e
-
-            # Toggle the BIT0(i.e. application-defined) and try again
-            if retries & 0x01:
-                bytes[0] |= 0x01
-                bytes[1] |= 0x01
-                bytes[2] |= 0x01
-                bytes[3] |= 0x01
-                bytes[4] |= 0x01
-                bytes[5] |= 0x01
-                bytes[6] |= 0x01
-                bytes[7] |= 0x01
-
-            self.write_bytes(STAGED_CS0_SELECT_ADDR[0], bytes)
-            self.write_bytes(STAGED_CS0_APPLY_ADDR[0], [0xff])
-            conf_ready = False
+            self._wait_word(self.get_datapath_activated_states, [DATAPATH_STATE_DEACTIVATED],
+                            0xffffffff, DP_DEACTIVATE_TIMEOUT, "CMIS4: checking datapath deactive states")
+
+            # Do application selection, toggling the BIT0(i.e. application-defined)
+            # on every other try
+            payload = self._staged_payload(application, lanes_per_port, retries & 0x01)
+
+            self._apply_staged_payload(payload)
 
             # Activate Hi-Power mode
             self.set_high_power()
 
-            for t in range(5):
-                time.sleep(1)
-                try:
-                    buf = self.get_config_errors()
-                    err = (buf[0] << 24) | (buf[1] << 16) | (buf[2] << 8) | buf[3]
-                    self.logger("CMIS4: checking config errors...{0},{1}".format(t, hex(err)))
-                    if (err & bitmask[lanes_per_port]) != \
-                        (CONFIG_STATE_ACCEPTED & bitmask[lanes_per_port]):
-                        continue
-                    conf_ready = True
-                    break
-                except:
-                    continue
-                conf_ready = True
-                break
+            conf_ready, err = self._wait_word(self.get_config_errors, [CONFIG_STATE_ACCEPTED],
+                                              bitmask[lanes_per_port], CONFIG_ACCEPT_TIMEOUT,
+                                              "CMIS4: checking config errors")
             if not conf_ready:
-                self.logger("CMIS4: AppSelect config set failed: {0}".format(hex(err)))
+                self.logger("CMIS4: AppSelect config set failed: {0}".format(None if err is None else hex(err)))
                 retries -= 1
                 continue
 
@@ -418,23 +479,13 @@ class cmis_init:
             #     AVAGO#AFCT-93DRPHZ-AZ2: 1x400->4x100G:  2 seconds
             #     DELL EMC#6MGDY:         4x100->1x400G:  8 seconds
             #     DELL EMC#6MGDY:         1x400->4x100G: 14 seconds
-            for t in range(30):
-                time.sleep(1)
-                buf = self.get_datapath_activated_states()
-                if buf is None:
-                    continue
-                err = (buf[0] << 24) | (buf[1] << 16) | (buf[2] << 8) | buf[3]
-                self.logger("CMIS4: checking datapath states...{0},{1}".format(t, hex(err)))
-                if (err & bitmask[lanes_per_port] != \
-                    DATAPATH_STATE_ACTIVATE & bitmask[lanes_per_port]) and \
-                    (err & bitmask[lanes_per_port] != \
-                    DATAPATH_STATE_INITIALIZED & bitmask[lanes_per_port]):
-                    continue
-                ready = True
-                break
+            ready, err = self._wait_word(self.get_datapath_activated_states,
+                                         [DATAPATH_STATE_ACTIVATE, DATAPATH_STATE_INITIALIZED],
+                                         bitmask[lanes_per_port], DP_ACTIVATE_TIMEOUT,
+                                         "CMIS4: checking datapath states")
             # Report config failure and try again
             if not ready:
-                self.logger("CMIS4: Init failed: DataPath state - {0}".format(hex(err)))
+                self.logger("CMIS4: Init failed: DataPath state - {0}".format(None if err is None else hex(err)))
             retries -= 1
         if ready:
             self.logger("CMIS4: Init completed")
@@ -488,13 +539,8 @@ class cmis_init:
             self.logger("Quick Init terminated with "+str(ret))
             return ret
 
-        intl_timeout = 5
         self.logger("Wait for INTL to be 0")
-        while self.get_intl_state() == True and intl_timeout > 0:
-            self.logger("Waiting for INTL to be 0, timeout(s): " +str(intl_timeout))
-            time.sleep(1)
-            intl_timeout -= 1
-        if (intl_timeout <= 0):
+        if not self._wait_intl_clear(5):
             self.logger("WARNING: INTL did not go to 0. Will continue ")
 
 
@@ -508,22 +554,11 @@ class cmis_init:
             self.logger("CMIS3: Setting datapath in deinit state")
             self.set_datapath_init(False)
 
-        err_d = [0, 0]
-        for t in range(20):
-            time.sleep(1)
-            buf = self.get_datapath_activated_states()
-            err_d[0] = (buf[0] << 24) | (buf[1] << 16) | (buf[2] << 8) | buf[3]
-            self.logger("CMIS3: checking datapath deactive states...{0},{1}".format(t, hex(err_d[0])))
-            if err_d[0] == 0x11111111:
-                break
+        self._wait_word(self.get_datapath_activated_states, [DATAPATH_STATE_DEACTIVATED],
+                        0xffffffff, DP_DEACTIVATE_TIMEOUT, "CMIS3: checking datapath deactive states")
 
-        intl_timeout = 10
         self.logger("Wait for INTL to be 0")
-        while self.get_intl_state() == True and intl_timeout > 0:
-            self.logger("Waiting for INTL to be 0, timeout(s): " +str(intl_timeout))
-            time.sleep(1)
-            intl_timeout -= 1
-        if (intl_timeout <= 0):
+        if not self._wait_intl_clear(10):
             self.logger("WARNING: INTL did not go to 0. Will continue ")
 
         self.logger("Getting module faults")
@@ -532,48 +567,11 @@ class cmis_init:
 
         dp_init_timeout = 0
         if init_type == INIT_TYPE_COMPLETE:
-            # Do application selection
-            bytes = []
-            for n in range(8):
-                bytes.append(application << 4)
-
-            # Setting up the first lane of each port/datapath
-            if lanes_per_port == 8:
-                pass
-            elif lanes_per_port == 4:
-                bytes[4] |= 0x08
-                bytes[5] |= 0x08
-                bytes[6] |= 0x08
-                bytes[7] |= 0x08
-            elif lanes_per_port == 2:
-                bytes[2] |= 0x04
-                bytes[3] |= 0x04
-                bytes[4] |= 0x08
-                bytes[5] |= 0x08
-                bytes[6] |= 0x0c
-                bytes[7] |= 0x0c
-            elif lanes_per_port == 1:
-                bytes[1] |= 0x02
-                bytes[2] |= 0x04
-                bytes[3] |= 0x06
-                bytes[4] |= 0x08
-                bytes[5] |= 0x0a
-                bytes[6] |= 0x0c
-                bytes[7] |= 0x0e
-
-            # Toggle the BIT0(i.e. application-defined) and try again
-            if retries == 0:
-                bytes[0] |= 0x01
-                bytes[1] |= 0x01
-                bytes[2] |= 0x01
-                bytes[3] |= 0x01
-                bytes[4] |= 0x01
-                bytes[5] |= 0x01
-                bytes[6] |= 0x01
-                bytes[7] |= 0x01
-
-            self.write_bytes(STAGED_CS0_SELECT_ADDR[0], bytes)
-            self.write_bytes(STAGED_CS0_APPLY_ADDR[0], [0xff])
+            # Do application selection, toggling the BIT0(i.e. application-defined)
+            # on the last try
+            payload = self._staged_payload(application, lanes_per_port, retries == 0)
+
+            self._apply_staged_payload(payload)
             # As per the spec after application select config is pushed 1 sec
             # sleep is required
             time.sleep(1)
@@ -602,12 +600,12 @@ class cmis_init:
                 return True
 
             dp_actv = self.get_datapath_activated_states()
-            dp_init_timeout /= 1000.0
+            deadline = time.monotonic() + (dp_init_timeout / 1000.0)
+            backoff = self._adaptive_wait()
 
-            while not test_dp_actv(dp_actv) and  dp_init_timeout > 0:
+            while not test_dp_actv(dp_actv) and time.monotonic() < deadline:
+                time.sleep(next(backoff))
                 dp_actv = self.get_datapath_activated_states()
-                time.sleep(1)
-                dp_init_timeout -= 1.0
 
         if init_type != INIT_TYPE_COMPLETE:
             self.logger("Setting SW-based high power")
@@ -380,7 +380,7 @@ class SfpUtilBase(object):
     def _read_eeprom_devid(self, port_num, devid, offset, num_bytes = 256):
         sysfs_sfp_i2c_client_eeprom_path = self._get_port_eeprom_path(port_num, devid)
 
-        if not self._sfp_eeprom_present(sysfs_sfp_i2c_client_eeprom_path, offset):
+        if not os.path.exists(sysfs_sfp_i2c_client_eeprom_path):
             return None
 
         try:
@@ -389,6 +389,14 @@ class SfpUtilBase(object):
             print("Error: reading sysfs file %s" % sysfs_sfp_i2c_client_eeprom_path)
             return None
 
+        # Same presence check as _sfp_eeprom_present, on the file opened for the read
+        try:
+            sysfsfile_eeprom.seek(offset)
+            sysfsfile_eeprom.read(1)
+        except Exception:
+            sysfsfile_eeprom.close()
+            return None
+
         eeprom_raw = self._read_eeprom_specific_bytes(sysfsfile_eeprom, offset, num_bytes)
 
         try:
@@ -1257,21 +1265,15 @@ class SfpUtilBase(object):
                 return None
 
             try:
-                dom_raw = []
-                while len(dom_raw) < 0x980:
-                    dom_raw.append('00')
+                dom_raw = ['00'] * 0x980
                 dom_pos = 0
                 tmp = self._read_eeprom_specific_bytes(sysfsfile_eeprom, dom_pos, 256)
                 if tmp is not None:
-                    for x in tmp:
-                        dom_raw[dom_pos] = x
-                        dom_pos += 1
+                    dom_raw[dom_pos:(dom_pos + len(tmp))] = tmp
                 dom_pos = 0x900
                 tmp = self._read_eeprom_specific_bytes(sysfsfile_eeprom, dom_pos, 128)
                 if tmp is not None:
-                    for x in tmp:
-                        dom_raw[dom_pos] = x
-                        dom_pos += 1
+                    dom_raw[dom_pos:(dom_pos + len(tmp))] = tmp
             except Exception as ex:
                 print("Error: {0}".format(ex))
                 return None
@@ -259,6 +259,24 @@ def _wrapper_clear_eeprom_cache(logical_port):
                                         "port '{}' Error {}".format(logical_port, ex))
     return
 
+def _wrapper_set_eeprom_read_cache(logical_port, enable):
+    if platform_chassis is not None:
+        physical_port_list = logical_port_name_to_physical_port_list(logical_port)
+        if physical_port_list is None:
+            return
+
+        for physical_port in physical_port_list:
+            try:
+                sfp = platform_chassis.get_sfp(physical_port)
+                if enable:
+                    sfp.enable_eeprom_read_cache()
+                else:
+                    sfp.disable_eeprom_read_cache()
+            except Exception:
+                # Expected when its SFP plugin does not inherit from SfpStandard
+                pass
+    return
+
 
 def _wrapper_get_transceiver_eeprom(physical_port, offset, length):
     if not _wrapper_get_presence(physical_port):
@@ -3192,8 +3210,13 @@ class DomInfoUpdateTask(object):
                     asic_index = 0
 
                 if not detect_port_in_error_status(logical_port_name, status_tbl[asic_index]):
-                    post_port_dom_info_to_db(logical_port_name, dom_tbl[asic_index], self.task_stopping_event, dom_cache)
-                    post_port_diag_info_to_db(logical_port_name, diag_tbl[asic_index], self.task_stopping_event, diag_cache)
+                    # DOM and DIAG both read the lower page, read it once for both
+                    _wrapper_set_eeprom_read_cache(logical_port_name, True)
+                    try:
+                        post_port_dom_info_to_db(logical_port_name, dom_tbl[asic_index], self.task_stopping_event, dom_cache)
+                        post_port_diag_info_to_db(logical_port_name, diag_tbl[asic_index], self.task_stopping_event, diag_cache)
+                    finally:
+                        _wrapper_set_eeprom_read_cache(logical_port_name, False)
 
                 time.sleep(poll_delay)
                 if self.task_stopping_event.is_set():